@@ -54,6 +54,7 @@ class Settings:
     
     # Telemetry settings
     TELEMETRY_UPDATE_RATE: int = int(os.getenv("TELEMETRY_UPDATE_RATE", "200"))
+    MAX_REDRAW_RATE: float = float(os.getenv("MAX_REDRAW_RATE", "10"))  # Hz, UI refresh cap
     MAP_UPDATE_RATE: int = int(os.getenv("MAP_UPDATE_RATE", "1000"))
     
     @classmethod
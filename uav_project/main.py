@@ -35,18 +35,33 @@ def check_webengine_availability():
         logging.error(f"QtWebEngine error: {e}")
         return False
 
+def gpu_rendering_enabled():
+    """GPU rendering is opt-in (GCS_ENABLE_GPU=1) since some drivers misbehave."""
+    return os.getenv("GCS_ENABLE_GPU", "0").lower() in ("1", "true", "yes")
+
 def setup_webengine_args():
     """Setup QtWebEngine arguments to avoid GPU issues."""
-    webengine_args = [
-        "--disable-gpu",
-        "--disable-software-rasterizer", 
-        "--disable-gpu-sandbox",
-        "--disable-web-security",
-        "--disable-features=VizDisplayCompositor",
-        "--ignore-gpu-blacklist",
-        "--enable-logging",
-        "--log-level=0"
-    ]
+    if gpu_rendering_enabled():
+        # Accelerated canvas/tile compositing for the Leaflet map
+        webengine_args = [
+            "--enable-gpu-rasterization",
+            "--enable-zero-copy",
+            "--ignore-gpu-blocklist",
+            "--disable-web-security",
+            "--enable-logging",
+            "--log-level=0"
+        ]
+    else:
+        webengine_args = [
+            "--disable-gpu",
+            "--disable-software-rasterizer", 
+            "--disable-gpu-sandbox",
+            "--disable-web-security",
+            "--disable-features=VizDisplayCompositor",
+            "--ignore-gpu-blacklist",
+            "--enable-logging",
+            "--log-level=0"
+        ]
     
     # Set environment variables for QtWebEngine
     os.environ['QTWEBENGINE_CHROMIUM_FLAGS'] = ' '.join(webengine_args)
@@ -67,7 +82,8 @@ def main():
         # Enable high DPI scaling and OpenGL context sharing (for QtWebEngine)
         QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        QApplication.setAttribute(Qt.AA_UseSoftwareOpenGL, True)
+        if not gpu_rendering_enabled():
+            QApplication.setAttribute(Qt.AA_UseSoftwareOpenGL, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         
         # Create application
@@ -0,0 +1,56 @@
+"""
+Download the pinned Leaflet release into the desktop UI resources.
+Run this script once so the map loads Leaflet from disk instead of the CDN.
+"""
+
+import base64
+import hashlib
+import urllib.request
+from pathlib import Path
+
+LEAFLET_VERSION = "1.9.4"
+LEAFLET_BASE_URL = f"https://unpkg.com/leaflet@{LEAFLET_VERSION}/dist/"
+
+# File -> SRI hash (same values as the integrity attributes in the map HTML)
+LEAFLET_FILES = {
+    "leaflet.js": "sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo=",
+    "leaflet.css": "sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY=",
+    "images/layers.png": None,
+    "images/layers-2x.png": None,
+    "images/marker-icon.png": None,
+    "images/marker-icon-2x.png": None,
+    "images/marker-shadow.png": None,
+}
+
+VENDOR_DIR = (Path(__file__).parent.parent / "src" / "uav_system" / "ui" / "desktop"
+              / "resources" / "vendor" / "leaflet")
+
+def sri_hash(data: bytes) -> str:
+    """Return the sha256 subresource-integrity string for data."""
+    return "sha256-" + base64.b64encode(hashlib.sha256(data).digest()).decode("ascii")
+
+def fetch_leaflet(dest: Path = VENDOR_DIR):
+    """Download and verify every Leaflet file into dest."""
+    for name, integrity in LEAFLET_FILES.items():
+        url = LEAFLET_BASE_URL + name
+        print(f"⬇️  {url}")
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+
+        if integrity and sri_hash(data) != integrity:
+            raise RuntimeError(f"Integrity check failed for {name}")
+
+        target = dest / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        print(f"✅ {target}")
+
+def main():
+    """Main function."""
+    print(f"🗺️ Leaflet {LEAFLET_VERSION} vendor download")
+    print("=" * 50)
+    fetch_leaflet()
+    print("\n🎉 Leaflet is ready for offline use")
+
+if __name__ == "__main__":
+    main()
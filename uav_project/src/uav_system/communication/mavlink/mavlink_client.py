@@ -25,6 +25,7 @@ class MAVLinkClient(BaseProtocol):
         self.telemetry_data = {}
         self.telemetry_thread = None
         self.message_handlers = {}
+        self.telemetry_callback = None
         self.last_heartbeat = 0
         self.system_id = 0
         self.component_id = 0
@@ -221,6 +222,9 @@ class MAVLinkClient(BaseProtocol):
             # Call registered handler if available
             if msg_type in self.message_handlers:
                 self.message_handlers[msg_type](msg)
+                # Notify the listener (runs on this RX thread; it copies what it keeps)
+                if self.telemetry_callback:
+                    self.telemetry_callback(self.telemetry_data)
                 
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
@@ -277,6 +281,13 @@ class MAVLinkClient(BaseProtocol):
         """Get current telemetry data (thread-safe)."""
         return self.telemetry_data.copy()
     
+    def set_telemetry_callback(self, callback: Optional[Callable[[Dict[str, Any]], None]]):
+        """Set a callback invoked with the live telemetry dict after each handled message.
+
+        The callback runs on the telemetry thread and must copy the dict before handing it on.
+        """
+        self.telemetry_callback = callback
+    
     def register_message_handler(self, msg_type: str, handler: Callable):
         """Register a custom message handler."""
         self.message_handlers[msg_type] = handler
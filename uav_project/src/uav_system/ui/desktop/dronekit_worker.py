@@ -0,0 +1,50 @@
+"""
+DroneKit worker for the desktop GCS.
+dronekit.connect() waits for heartbeats and parameters (up to its timeout), so it runs off the GUI thread.
+"""
+
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DroneKitWorker(QObject):
+    """Performs the blocking DroneKit connect in its own thread."""
+
+    # Connected Vehicle (or None) and an error message ("" on success)
+    connectFinished = pyqtSignal(object, str)
+
+    @pyqtSlot(str)
+    def run(self, connection_string: str):
+        """Connect to the vehicle (blocking, runs in the worker thread)."""
+        # Suppress DroneKit logging for mode compatibility issues
+        dronekit_logger = logging.getLogger('dronekit')
+        original_level = dronekit_logger.level
+        dronekit_logger.setLevel(logging.CRITICAL)
+
+        try:
+            import dronekit
+            vehicle = dronekit.connect(
+                connection_string,
+                wait_ready=['gps_0', 'armed', 'mode', 'attitude'],
+                timeout=15
+            )
+            self.connectFinished.emit(vehicle, "")
+        except Exception as e:
+            logger.error(f"DroneKit connection failed: {e}")
+            self.connectFinished.emit(None, str(e))
+        finally:
+            # Restore original logging level
+            dronekit_logger.setLevel(original_level)
+
+    @pyqtSlot(object)
+    def close(self, vehicle):
+        """Close a vehicle; may block on a lost link, so it also runs here."""
+        try:
+            vehicle.close()
+        except Exception as e:
+            logger.error(f"DroneKit close failed: {e}")
@@ -3,40 +3,34 @@
 
 from PyQt5.QtWidgets import QWidget, QSizePolicy
 from PyQt5.QtGui import (
-    QPainter, QColor, QPen, QFont, QPainterPath, 
+    QPainter, QColor, QPen, QFont, QPainterPath, QImage,
     QFontMetrics, QPolygon, QRadialGradient, QBrush, QLinearGradient
 )
-from PyQt5.QtCore import Qt, QRectF, QLineF, QPointF, QPoint, QRect
+from PyQt5.QtCore import (
+    Qt, QRectF, QLineF, QPointF, QPoint, QRect, QSize, QTimer,
+    QObject, QThread, QMutex, QMutexLocker, QCoreApplication,
+    pyqtSignal, pyqtSlot
+)
 import math
 
+from ...core.logging_config import get_logger
 
-class HUDWidget(QWidget):
-    def __init__(self, parent=None):
-        super(HUDWidget, self).__init__(parent)
-        # Eğer eski updateData ve setConnectionState silindiyse, yeniden ekle:
-        self.roll_value = 0.0
-        self.pitch_value = 0.0
-        self.yaw_value = 0.0
-        # Uçuş bilgileri
-        self._roll = 0.0
-        self._pitch = 0.0
-        self._yaw = 0.0
-        self._airspeed = 0.0
-        self._altitude = 0.0
-        self._groundspeed = 0.0
-        self._heading = 0.0
-        self._throttle = 0.0
-        self._batteryLevel = 100.0
-        self._batteryVoltage = 12.6
-        self._batteryCurrent = 0.0
-        self._armable = False
-        self._armed = False
-        self._flightMode = "UNKNOWN"
-        self._gpsStatus = 0        # 0=No fix, 1=GPS fix, 2=DGPS
-        self._gpsSatellites = 0    # Görünür uydu sayısı
-        self._waypointDist = 0.0   # Hedef noktaya mesafe
-        self._targetBearing = 0.0  # Hedef yönü
-        
+logger = get_logger(__name__)
+
+
+class HUDRenderer(QObject):
+    """
+    HUD karelerini GUI iş parçacığı dışında, ARGB32 premultiplied bir
+    QImage üzerine çizer. HUDWidget tarafından ayrı bir QThread'e taşınır;
+    her render isteği bir telemetri kopyası alır ve frame_ready ile biter.
+    """
+    frame_ready = pyqtSignal(QImage)
+
+    # Pitch faktörü - açı başına kaç piksel (reduced for better visibility)
+    PITCH_FACTOR = 2.5
+
+    def __init__(self):
+        super(HUDRenderer, self).__init__()
         # Koyu tema renkleri
         self._backgroundColor = QColor(10, 10, 20)  # Çok koyu lacivert
         self._horizonColor = QColor(0, 200, 0)      # Parlak yeşil
@@ -49,102 +43,23 @@ class HUDWidget(QWidget):
         self._dangerColor = QColor(255, 0, 0)       # Kırmızı tehlike rengi
         self._textColor = QColor(255, 255, 255)     # Beyaz metin rengi
         
-        # Bu widget'ın arka planını koyu lacivert yap
-        self.setStyleSheet("background-color: rgb(10, 10, 20); border: 2px solid red;")
+        self._pitchFont = QFont("Arial", 9, QFont.Bold)
         
-        # Size policy'yi ayarlayarak widget'ın parent'ı tamamen doldurmasını sağla
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        # Telemetri verilerini saklayacak dict:
-        self._data = {
-            "roll": self._roll,                  # Euler açıları (derece)
-            "pitch": self._pitch,  
-            "yaw": self._yaw,  
-            "airspeed": self._airspeed,          # m/s
-            "groundspeed": self._groundspeed,    # m/s
-            "altitude": self._altitude,          # metre
-            "throttle": self._throttle,          # % (0-100)
-            "batteryLevel": self._batteryLevel,  # % (0-100)
-            "batteryVoltage": self._batteryVoltage, # Volt
-            "batteryCurrent": self._batteryCurrent, # Amper
-            "armed": self._armed,                # True/False
-            "armable": self._armable,            # True/False
-            "flightMode": self._flightMode,      # "AUTO", "LOITER", vb.
-            "gpsStatus": self._gpsStatus,        # 0=No fix, 1=GPS fix, 2=DGPS
-            "gpsSatellites": self._gpsSatellites, # Görünür uydu sayısı
-            "waypointDist": self._waypointDist,  # metre
-            "targetBearing": self._targetBearing # derece
-        }
+        # Gösterge yerleşimi (boyut değiştiğinde yeniden hesaplanır)
+        self._layout_size = None
         
-        # Bağlantı durumu - telemetri verisinin gerçek olup olmadığını belirtir
-        self._isConnected = False
-    """def updateData(self, data: dict):
-        super().updateData(data)
-    """
-    """def setConnectionState(self, connected: bool):
-        super().setConnectionState(connected)
-    """
-    
-    def updateData(self, data: dict):
-        """
-        HUD’un internal _data sözlüğünü günceller ve
-        paint/update() metodunu çağırır.
-        """
-        self._data.update(data)
-        self.update()
+        # Çift arka tampon: biri widget'ta gösterilirken diğerine çizilir
+        self._backbuffers = []
+        self._backbuffer_index = 0
 
-    def setConnectionState(self, connected: bool):
-        """
-        Bağlantı durumunu HUD içindeki flag’e yazar
-        ve yeniden çizer.
+    def _update_layout(self, size: QSize):
         """
-        self._isConnected = connected
-        self.update()
-    
-    def update_flight_data(self, data: dict):
+        Çizim boyutuna bağlı gösterge geometrisini hesaplar.
+        Dikdörtgenler tam sayı piksellere yuvarlanır ve her karede yeniden
+        kullanılır; böylece çizim QRect (int) yolunu izler.
         """
-        data içindeki alanları field_mapping üzerinden
-        HUD’in internal _data sözlüğüne map’ler ve updateData()’yı çağırır.
-        """
-        field_mapping = {
-            'roll': 'roll',
-            'pitch': 'pitch', 
-            'yaw': 'yaw',
-            'airspeed': 'airspeed',
-            'groundspeed': 'groundspeed',
-            'altitude': 'altitude',
-            'throttle': 'throttle',
-            'batteryLevel': 'batteryLevel',
-            'batteryVoltage': 'batteryVoltage',
-            'batteryCurrent': 'batteryCurrent',
-            'armed': 'armed',
-            'armable': 'armable',
-            'flightMode': 'flightMode',
-            'gpsStatus': 'gpsStatus',
-            'gpsSatellites': 'gpsSatellites',
-            'waypointDist': 'waypointDist',
-            'targetBearing': 'targetBearing'
-        }
-        
-        mapped = {}
-        for src, dst in field_mapping.items():
-            if src in data:
-                mapped[dst] = data[src]        
-        self.updateData(mapped)
-
-    def set_connection_status(self, connected: bool):
-        """Bağlantı durumunu HUD’e bildirir."""
-        self.setConnectionState(connected)
-        
-    def paintEvent(self, event):
-        # Debug: HUD çizimi başlıyor
-        print(f"HUD paintEvent called - size: {self.width()}x{self.height()}")
-        
-        # Get widget dimensions
-        w = self.width()
-        h = self.height()
-        
-        # Calculate center x and center y
+        w = size.width()
+        h = size.height()
         cx = w / 2
         cy = h / 2
         
@@ -154,91 +69,205 @@ class HUDWidget(QWidget):
         footer_height = 60
         side_width = 80
         
+        self._center = (cx, cy)
+        
         # Calculate artificial horizon size (central focus)
-        horizon_radius = min((w - 2 * side_width - 4 * margin) / 3, 
-                           (h - header_height - footer_height - 2 * margin) / 3)
+        self._horizon_radius = min((w - 2 * side_width - 4 * margin) / 3, 
+                                   (h - header_height - footer_height - 2 * margin) / 3)
         
-        p = QPainter(self)
+        # === HEADER SECTION (Top) ===
+        self._flight_mode_y = margin + 25
+        self._rect_gps = QRect(margin, margin, 120, 35)
+        self._rect_battery = QRect(w - margin - 120, margin, 120, 35)
+        
+        # === CENTRAL SECTION (Main display area) ===
+        compass_y = margin + header_height + 20
+        compass_width = round(w * 0.35)
+        self._rect_compass = QRect(round(cx - compass_width / 2), compass_y - 30, 
+                                   compass_width, 60)
+        
+        indicator_height = round(h * 0.4)
+        indicator_top = round(cy - indicator_height / 2)
+        airspeed_x = margin + side_width // 2
+        altitude_x = w - margin - side_width // 2
+        self._rect_airspeed = QRect(airspeed_x - 40, indicator_top, 80, indicator_height)
+        self._rect_altitude = QRect(altitude_x - 40, indicator_top, 80, indicator_height)
+        
+        # === FOOTER SECTION (Bottom) ===
+        footer_y = h - footer_height
+        self._rect_throttle = QRect(margin, footer_y + 20, 120, 25)
+        self._groundspeed_y = footer_y + 30
+        self._rect_waypoint = QRect(w - margin - 120, footer_y + 15, 120, 35)
+        
+        # Pitch merdiveni yalnızca span'e bağlıdır; roll/pitch dönüşümü
+        # çizim sırasında QPainter tarafından uygulanır
+        self._build_pitch_ladder(self._horizon_radius)
+        self._build_center_overlay(cx, cy, self._horizon_radius)
+        
+        # Arka tamponlar yalnızca boyut değiştiğinde yeniden ayrılır
+        self._backbuffers = [QImage(size, QImage.Format_ARGB32_Premultiplied)
+                             for _ in range(2)]
+        self._backbuffer_index = 0
+        
+        self._layout_size = QSize(size)
+        
+    def _build_pitch_ladder(self, span: float):
+        """Pitch çizgilerini ve etiket konumlarını ufuk koordinatlarında hesaplar."""
+        self._pitch_major_lines = []
+        self._pitch_minor_lines = []
+        self._pitch_labels = []
+        fm = QFontMetrics(self._pitchFont)
+        
+        # Pitch açı aralıkları - Reduced density
+        for angle in range(-60, 61, 10):
+            if angle == 0:
+                continue  # Ufuk çizgisi ayrıca çizilir
+                
+            y = -angle * self.PITCH_FACTOR  # Pitch değerini piksel konumuna çevir
+            
+            if angle % 30 == 0:
+                width = span * 0.7
+                self._pitch_major_lines.append(QLineF(-width/2, y, width/2, y))
+            else:
+                width = span * 0.4
+                self._pitch_minor_lines.append(QLineF(-width/2, y, width/2, y))
+            
+            if angle % 20 == 0:
+                text = f"{abs(angle)}°"
+                text_width = fm.width(text)
+                self._pitch_labels.append((int(-width/2 - text_width - 8), int(y + 4), text))
+                self._pitch_labels.append((int(width/2 + 8), int(y + 4), text))
+
+    def _build_center_overlay(self, cx: float, cy: float, span: float):
+        """
+        Yapay ufkun sabit merkez çizgilerini ve roll üçgenlerini hesaplar;
+        her çizgi grubu tek bir drawLines çağrısıyla çizilir.
+        """
+        # Merkez artı işareti (widget koordinatları)
+        center_size = 10
+        self._center_cross_lines = [
+            QLineF(int(cx - center_size), int(cy), int(cx + center_size), int(cy)),
+            QLineF(int(cx), int(cy - center_size), int(cx), int(cy + center_size))
+        ]
+        
+        # Aircraft symbol ve yatay referans çizgileri (merkeze göre)
+        symbol_size = span * 0.12
+        horizon_ref_length = span * 1.8
+        self._aircraft_symbol_lines = [
+            QLineF(-symbol_size, 0, -symbol_size/2, symbol_size/4),
+            QLineF(-symbol_size/2, symbol_size/4, 0, 0),
+            QLineF(0, 0, symbol_size/2, symbol_size/4),
+            QLineF(symbol_size/2, symbol_size/4, symbol_size, 0),
+            QLineF(-horizon_ref_length, 0, -span*1.1, 0),
+            QLineF(span*1.1, 0, horizon_ref_length, 0)
+        ]
+        
+        # Roll göstergesi üçgenleri (merkeze göre, döndürme çizimde uygulanır)
+        self._roll_top_triangle = QPolygon([
+            QPoint(0, int(-span - 20)),
+            QPoint(-12, int(-span)),
+            QPoint(12, int(-span))
+        ])
+        self._roll_needle_polygon = QPolygon([
+            QPoint(0, int(-span - 20)),
+            QPoint(-10, int(-span)),
+            QPoint(10, int(-span))
+        ])
+
+    @pyqtSlot(QSize, dict, bool)
+    def render(self, size: QSize, data: dict, connected: bool):
+        """Verilen telemetri kopyasıyla bir HUD karesi çizer."""
+        if size.isEmpty():
+            self.frame_ready.emit(QImage())
+            return
+        
+        if self._layout_size != size:
+            self._update_layout(size)
+        
+        cx, cy = self._center
+        
+        # Widget son kareyi bırakmış olduğundan sıradaki tampon paylaşılmaz
+        # ve QPainter kopya oluşturmadan doğrudan üzerine çizer
+        image = self._backbuffers[self._backbuffer_index]
+        self._backbuffer_index ^= 1
+        p = QPainter(image)
         p.setRenderHint(QPainter.Antialiasing)
         
         # Arka planı siyah olarak ayarla
-        p.fillRect(event.rect(), QColor(0, 0, 0))
+        p.fillRect(image.rect(), QColor(0, 0, 0))
         
         # Bağlantı yoksa, bağlantı mesajını göster
-        if not self._isConnected:
+        if not connected:
             p.setPen(QColor(255, 0, 0))  # Kırmızı renk
             font = p.font()
             font.setPointSize(14)
             p.setFont(font)
             
             # Ekran merkezinde uyarı mesajını göster
-            p.drawText(self.rect(), Qt.AlignCenter, "UAV TELEMETRY CONNECTION REQUIRED")
+            p.drawText(image.rect(), Qt.AlignCenter, "UAV TELEMETRY CONNECTION REQUIRED")
             
             # Küçük bir açıklama
             font.setPointSize(10)
             p.setFont(font)
-            p.drawText(self.rect().adjusted(0, 40, 0, 0), Qt.AlignCenter, 
+            p.drawText(image.rect().adjusted(0, 40, 0, 0), Qt.AlignCenter, 
                        "Press 'Connect' button to establish connection")
+            p.end()
+            self.frame_ready.emit(image)
             return
     
         # === HEADER SECTION (Top) ===
         # Flight mode and armed status - Top center
-        self.drawFlightMode(p, cx, margin + 25, 
-                      self._data["flightMode"], 
-                      self._data["armed"])
+        self.drawFlightMode(p, cx, self._flight_mode_y, 
+                      data["flightMode"], 
+                      data["armed"])
         
         # GPS status - Top left
-        self.drawGpsStatus(p, margin, margin, 120, 35, 
-                     self._data["gpsStatus"], 
-                     self._data["gpsSatellites"])
+        self.drawGpsStatus(p, self._rect_gps, 
+                     data["gpsStatus"], 
+                     data["gpsSatellites"])
         
         # Battery status - Top right
-        self.drawBatteryStatus(p, w - margin - 120, margin, 120, 35, 
-                         self._data["batteryLevel"],
-                         self._data["batteryVoltage"],
-                         self._data["batteryCurrent"])
+        self.drawBatteryStatus(p, self._rect_battery, 
+                         data["batteryLevel"],
+                         data["batteryVoltage"],
+                         data["batteryCurrent"])
         
         # === CENTRAL SECTION (Main display area) ===
         # Artificial Horizon - Center (main focus)
         self.drawArtificialHorizon(p, cx, cy, 
-                               self._data["roll"], 
-                               self._data["pitch"], 
-                               span=horizon_radius)
+                               data["roll"], 
+                               data["pitch"], 
+                               span=self._horizon_radius)
         
         # Compass - Above artificial horizon with proper spacing
-        compass_y = margin + header_height + 20
-        self.drawCompass(p, cx, compass_y, w * 0.35, 
-                     self._data["yaw"])
+        self.drawCompass(p, self._rect_compass, 
+                     data["yaw"])
         
         # Airspeed indicator - Left side, vertically centered
-        airspeed_x = margin + side_width/2
-        airspeed_height = h * 0.4
-        self.drawAirspeedIndicator(p, airspeed_x, cy, airspeed_height,
-                             self._data["airspeed"])
+        self.drawAirspeedIndicator(p, self._rect_airspeed,
+                             data["airspeed"])
         
         # Altitude indicator - Right side, vertically centered
-        altitude_x = w - margin - side_width/2
-        self.drawAltitudeIndicator(p, altitude_x, cy, airspeed_height, 
-                             self._data["altitude"])
+        self.drawAltitudeIndicator(p, self._rect_altitude, 
+                             data["altitude"])
         
         # === FOOTER SECTION (Bottom) ===
-        footer_y = h - footer_height
-        
         # Throttle indicator - Bottom left
-        self.drawThrottleIndicator(p, margin, footer_y + 20, 120, 25, 
-                           self._data["throttle"])
+        self.drawThrottleIndicator(p, self._rect_throttle, 
+                           data["throttle"])
         
         # Ground speed - Bottom center
-        self.drawGroundspeedIndicator(p, cx, footer_y + 30, 
-                               self._data["groundspeed"])
+        self.drawGroundspeedIndicator(p, cx, self._groundspeed_y, 
+                               data["groundspeed"])
         
         # Waypoint info - Bottom right
-        self.drawWaypointInfo(p, w - margin - 120, footer_y + 15, 120, 35,
-                        self._data["waypointDist"], 
-                        self._data["targetBearing"])
+        self.drawWaypointInfo(p, self._rect_waypoint,
+                        data["waypointDist"], 
+                        data["targetBearing"])
         
         p.end()
-        
+        self.frame_ready.emit(image)
+
     def drawArtificialHorizon(self, p: QPainter,
                              cx: float, cy: float,
                              roll: float, pitch: float,
@@ -259,9 +288,7 @@ class HUDWidget(QWidget):
         
         # Merkez nokta
         p.setPen(QPen(self._primaryColor, 3))
-        center_size = 10
-        p.drawLine(int(cx - center_size), int(cy), int(cx + center_size), int(cy))
-        p.drawLine(int(cx), int(cy - center_size), int(cx), int(cy + center_size))
+        p.drawLines(self._center_cross_lines)
         
         # Çerçeve
         p.setPen(QPen(self._primaryColor, 2))
@@ -279,9 +306,7 @@ class HUDWidget(QWidget):
         p.translate(cx, cy)
         p.rotate(-roll)  # Roll açısını uygula
         
-        # Pitch faktörü - açı başına kaç piksel (reduced for better visibility)
-        pitch_factor = 2.5
-        pitch_offset = pitch * pitch_factor
+        pitch_offset = pitch * self.PITCH_FACTOR
         p.translate(0, pitch_offset)  # Pitch açısını uygula
 
         # Gökyüzü ve zemin (dikey olarak genişletilmiş)
@@ -296,38 +321,20 @@ class HUDWidget(QWidget):
         p.setPen(horizon_pen)
         p.drawLine(QLineF(-span*1.5, 0, span*1.5, 0))
         
-        # Pitch çizgileri - Simplified for better readability
-        p.setFont(QFont("Arial", 9, QFont.Bold))
-        pitch_pen = QPen(self._primaryColor)
-        pitch_pen.setWidth(2)
-        p.setPen(pitch_pen)
+        # Pitch çizgileri - geometri _build_pitch_ladder'da önceden hesaplanır
+        p.setFont(self._pitchFont)
         
-        # Pitch açı aralıkları - Reduced density
-        for angle in range(-60, 61, 10):
-            if angle == 0:
-                continue  # Ufuk çizgisi zaten çizildi
-                
-            y = -angle * pitch_factor  # Pitch değerini piksel konumuna çevir
-            
-            if angle % 30 == 0:
-                # 30 derece bölmeler için uzun çizgiler
-                width = span * 0.7
-                p.setPen(QPen(self._primaryColor, 3))
-            else:
-                # 10 derece bölmeler için orta çizgiler
-                width = span * 0.4
-                p.setPen(QPen(self._primaryColor, 2))
-                
-            # Yatay çizgiyi çiz
-            p.drawLine(QLineF(-width/2, y, width/2, y))
-            
-            # Açı etiketlerini ekle (20 derecelik artışlarla)
-            if angle != 0 and angle % 20 == 0:
-                text = f"{abs(angle)}°"
-                fm = QFontMetrics(p.font())
-                text_width = fm.width(text)
-                p.drawText(int(-width/2 - text_width - 8), int(y + 4), text)
-                p.drawText(int(width/2 + 8), int(y + 4), text)
+        # 10 derece bölmeler için orta çizgiler
+        p.setPen(QPen(self._primaryColor, 2))
+        p.drawLines(self._pitch_minor_lines)
+        
+        # 30 derece bölmeler için uzun çizgiler
+        p.setPen(QPen(self._primaryColor, 3))
+        p.drawLines(self._pitch_major_lines)
+        
+        # Açı etiketleri (20 derecelik artışlarla)
+        for x, y, text in self._pitch_labels:
+            p.drawText(x, y, text)
         
         # Attitude indicator'ın ortasında sabit merkez sembolü - Enhanced design
         p.resetTransform()
@@ -337,22 +344,13 @@ class HUDWidget(QWidget):
         center_indicator_pen.setWidth(3)
         p.setPen(center_indicator_pen)
         
-        # Merkez sembol - Aircraft symbol
-        symbol_size = span * 0.12
-        p.drawLine(QLineF(-symbol_size, 0, -symbol_size/2, symbol_size/4))
-        p.drawLine(QLineF(-symbol_size/2, symbol_size/4, 0, 0))
-        p.drawLine(QLineF(0, 0, symbol_size/2, symbol_size/4))
-        p.drawLine(QLineF(symbol_size/2, symbol_size/4, symbol_size, 0))
+        # Merkez sembol (Aircraft symbol) ve yatay referans çizgileri
+        p.drawLines(self._aircraft_symbol_lines)
         
         # Merkez nokta
         p.setBrush(QBrush(self._primaryColor))
         p.drawEllipse(QPointF(0, 0), 3, 3)
         
-        # Yatay referans çizgileri - Extended for better visibility
-        horizon_ref_length = span * 1.8
-        p.drawLine(QLineF(-horizon_ref_length, 0, -span*1.1, 0))
-        p.drawLine(QLineF(span*1.1, 0, horizon_ref_length, 0))
-        
         p.restore()
         
         # Döner dış çerçeve (roll göstergesi) - Enhanced design
@@ -373,12 +371,7 @@ class HUDWidget(QWidget):
             if angle == 0:
                 # Üstteki işaret (0 derece) - Prominent triangle
                 p.setBrush(QBrush(self._primaryColor))
-                points = [
-                    QPoint(0, int(-span - 20)),
-                    QPoint(-12, int(-span)),
-                    QPoint(12, int(-span))
-                ]
-                p.drawPolygon(QPolygon(points))
+                p.drawPolygon(self._roll_top_triangle)
             elif angle == 180:
                 # Alttaki işaret (180 derece) - Small marker
                 p.drawLine(QLineF(0, -span, 0, -span - 8))
@@ -395,21 +388,15 @@ class HUDWidget(QWidget):
         p.rotate(-roll)
         p.setBrush(QBrush(self._warningColor))
         p.setPen(QPen(self._warningColor, 2))
-        indicator_points = [
-            QPoint(0, int(-span - 20)),
-            QPoint(-10, int(-span)),
-            QPoint(10, int(-span))
-        ]
-        p.drawPolygon(QPolygon(indicator_points))
+        p.drawPolygon(self._roll_needle_polygon)
         
         p.restore()
 
-    def drawCompass(self, p: QPainter, cx: float, cy: float, width: float, heading: float):
+    def drawCompass(self, p: QPainter, compass_rect: QRect, heading: float):
         """Pusula göstergesi"""
         p.save()
         
         # Pusula çerçevesi
-        compass_rect = QRectF(cx - width/2, cy - 30, width, 60)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(compass_rect)
         
@@ -421,51 +408,50 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawAirspeedIndicator(self, p: QPainter, x: float, cy: float, height: float, airspeed: float):
+    def drawAirspeedIndicator(self, p: QPainter, indicator_rect: QRect, airspeed: float):
         """Hava hızı göstergesi"""
         p.save()
         
         # Gösterge alanı
-        indicator_rect = QRectF(x - 40, cy - height/2, 80, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(indicator_rect)
         
         # Hız değeri
         p.setFont(QFont("Arial", 10, QFont.Bold))
         p.setPen(self._textColor)
-        p.drawText(indicator_rect.adjusted(5, 5, -5, -height/2), Qt.AlignTop, "AIRSPEED")
+        p.drawText(indicator_rect.adjusted(5, 5, -5, -indicator_rect.height() // 2), 
+                   Qt.AlignTop, "AIRSPEED")
         
         speed_text = f"{airspeed:.1f} m/s"
         p.drawText(indicator_rect, Qt.AlignCenter, speed_text)
         
         p.restore()
 
-    def drawAltitudeIndicator(self, p: QPainter, x: float, cy: float, height: float, altitude: float):
+    def drawAltitudeIndicator(self, p: QPainter, indicator_rect: QRect, altitude: float):
         """İrtifa göstergesi"""
         p.save()
         
         # Gösterge alanı
-        indicator_rect = QRectF(x - 40, cy - height/2, 80, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(indicator_rect)
         
         # İrtifa değeri
         p.setFont(QFont("Arial", 10, QFont.Bold))
         p.setPen(self._textColor)
-        p.drawText(indicator_rect.adjusted(5, 5, -5, -height/2), Qt.AlignTop, "ALTITUDE")
+        p.drawText(indicator_rect.adjusted(5, 5, -5, -indicator_rect.height() // 2), 
+                   Qt.AlignTop, "ALTITUDE")
         
         alt_text = f"{altitude:.1f} m"
         p.drawText(indicator_rect, Qt.AlignCenter, alt_text)
         
         p.restore()
 
-    def drawBatteryStatus(self, p: QPainter, x: float, y: float, width: float, height: float, 
+    def drawBatteryStatus(self, p: QPainter, battery_rect: QRect, 
                          level: float, voltage: float, current: float):
         """Batarya durumu göstergesi"""
         p.save()
         
         # Batarya çerçevesi
-        battery_rect = QRectF(x, y, width, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(battery_rect)
         
@@ -478,9 +464,9 @@ class HUDWidget(QWidget):
             fill_color = self._dangerColor
         
         # Batarya dolgu seviyesi
-        fill_width = (width - 4) * (level / 100.0)
-        fill_rect = QRectF(x + 2, y + 2, fill_width, height - 4)
-        p.fillRect(fill_rect, fill_color)
+        fill_width = round((battery_rect.width() - 4) * (level / 100.0))
+        p.fillRect(battery_rect.x() + 2, battery_rect.y() + 2, 
+                   fill_width, battery_rect.height() - 4, fill_color)
         
         # Batarya metni
         p.setFont(QFont("Arial", 9))
@@ -490,13 +476,12 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawGpsStatus(self, p: QPainter, x: float, y: float, width: float, height: float, 
+    def drawGpsStatus(self, p: QPainter, gps_rect: QRect, 
                      status: int, satellites: int):
         """GPS durumu göstergesi"""
         p.save()
         
         # GPS çerçevesi
-        gps_rect = QRectF(x, y, width, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(gps_rect)
         
@@ -519,7 +504,7 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawFlightMode(self, p: QPainter, cx: float, y: float, mode: str, armed: bool):
+    def drawFlightMode(self, p: QPainter, cx: float, y: int, mode: str, armed: bool):
         """Uçuş modu göstergesi"""
         p.save()
         
@@ -539,7 +524,7 @@ class HUDWidget(QWidget):
         text_width = fm.width(mode_text)
         text_height = fm.height()
         
-        text_rect = QRectF(cx - text_width/2 - 10, y - text_height/2 - 5, 
+        text_rect = QRect(round(cx - text_width / 2) - 10, y - text_height // 2 - 5, 
                           text_width + 20, text_height + 10)
         
         p.setPen(QPen(self._primaryColor, 2))
@@ -555,19 +540,18 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawThrottleIndicator(self, p: QPainter, x: float, y: float, width: float, height: float, throttle: float):
+    def drawThrottleIndicator(self, p: QPainter, throttle_rect: QRect, throttle: float):
         """Gaz kelebeği göstergesi"""
         p.save()
         
         # Throttle çerçevesi
-        throttle_rect = QRectF(x, y, width, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(throttle_rect)
         
         # Throttle seviyesi
-        fill_width = (width - 4) * (throttle / 100.0)
-        fill_rect = QRectF(x + 2, y + 2, fill_width, height - 4)
-        p.fillRect(fill_rect, self._primaryColor)
+        fill_width = round((throttle_rect.width() - 4) * (throttle / 100.0))
+        p.fillRect(throttle_rect.x() + 2, throttle_rect.y() + 2, 
+                   fill_width, throttle_rect.height() - 4, self._primaryColor)
         
         # Throttle metni
         p.setFont(QFont("Arial", 9))
@@ -577,7 +561,7 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawGroundspeedIndicator(self, p: QPainter, cx: float, y: float, groundspeed: float):
+    def drawGroundspeedIndicator(self, p: QPainter, cx: float, y: int, groundspeed: float):
         """Yer hızı göstergesi"""
         p.save()
         
@@ -589,7 +573,7 @@ class HUDWidget(QWidget):
         fm = QFontMetrics(p.font())
         text_width = fm.width(speed_text)
         
-        text_rect = QRectF(cx - text_width/2 - 5, y - 10, text_width + 10, 20)
+        text_rect = QRect(round(cx - text_width / 2) - 5, y - 10, text_width + 10, 20)
         p.setPen(QPen(self._primaryColor, 1))
         p.drawRect(text_rect)
         
@@ -598,13 +582,12 @@ class HUDWidget(QWidget):
         
         p.restore()
 
-    def drawWaypointInfo(self, p: QPainter, x: float, y: float, width: float, height: float, 
+    def drawWaypointInfo(self, p: QPainter, wp_rect: QRect, 
                         distance: float, bearing: float):
         """Waypoint bilgi göstergesi"""
         p.save()
         
         # Waypoint çerçevesi
-        wp_rect = QRectF(x, y, width, height)
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(wp_rect)
         
@@ -621,7 +604,7 @@ class HUDWidget(QWidget):
         p.save()
         
         # Panel çerçevesi
-        panel_rect = QRectF(cx - width/2, y, width, height)
+        panel_rect = QRect(round(cx - width / 2), round(y), round(width), round(height))
         p.setPen(QPen(self._primaryColor, 2))
         p.drawRect(panel_rect)
         
@@ -633,6 +616,212 @@ class HUDWidget(QWidget):
         
         p.restore()
 
+
+class HUDWidget(QWidget):
+    # Çizim iş parçacığına gönderilen istek: boyut, telemetri kopyası, bağlantı
+    render_requested = pyqtSignal(QSize, dict, bool)
+
+    def __init__(self, parent=None):
+        super(HUDWidget, self).__init__(parent)
+        # Eğer eski updateData ve setConnectionState silindiyse, yeniden ekle:
+        self.roll_value = 0.0
+        self.pitch_value = 0.0
+        self.yaw_value = 0.0
+        # Uçuş bilgileri
+        self._roll = 0.0
+        self._pitch = 0.0
+        self._yaw = 0.0
+        self._airspeed = 0.0
+        self._altitude = 0.0
+        self._groundspeed = 0.0
+        self._heading = 0.0
+        self._throttle = 0.0
+        self._batteryLevel = 100.0
+        self._batteryVoltage = 12.6
+        self._batteryCurrent = 0.0
+        self._armable = False
+        self._armed = False
+        self._flightMode = "UNKNOWN"
+        self._gpsStatus = 0        # 0=No fix, 1=GPS fix, 2=DGPS
+        self._gpsSatellites = 0    # Görünür uydu sayısı
+        self._waypointDist = 0.0   # Hedef noktaya mesafe
+        self._targetBearing = 0.0  # Hedef yönü
+        
+        # Her kare widget'ın tamamını kapladığından Qt'nin arka plan
+        # doldurmasına ve stil sayfası çizimine gerek yok
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        
+        # Size policy'yi ayarlayarak widget'ın parent'ı tamamen doldurmasını sağla
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Telemetri verilerini saklayacak dict:
+        self._data = {
+            "roll": self._roll,                  # Euler açıları (derece)
+            "pitch": self._pitch,  
+            "yaw": self._yaw,  
+            "airspeed": self._airspeed,          # m/s
+            "groundspeed": self._groundspeed,    # m/s
+            "altitude": self._altitude,          # metre
+            "throttle": self._throttle,          # % (0-100)
+            "batteryLevel": self._batteryLevel,  # % (0-100)
+            "batteryVoltage": self._batteryVoltage, # Volt
+            "batteryCurrent": self._batteryCurrent, # Amper
+            "armed": self._armed,                # True/False
+            "armable": self._armable,            # True/False
+            "flightMode": self._flightMode,      # "AUTO", "LOITER", vb.
+            "gpsStatus": self._gpsStatus,        # 0=No fix, 1=GPS fix, 2=DGPS
+            "gpsSatellites": self._gpsSatellites, # Görünür uydu sayısı
+            "waypointDist": self._waypointDist,  # metre
+            "targetBearing": self._targetBearing # derece
+        }
+        
+        # Bağlantı durumu - telemetri verisinin gerçek olup olmadığını belirtir
+        self._isConnected = False
+        
+        # Arka plan çizim iş parçacığı: kareler QImage üzerine çizilir,
+        # paintEvent yalnızca son kareyi widget'a kopyalar
+        self._last_frame = QImage()
+        self._frame_mutex = QMutex()
+        self._render_pending = False
+        self._render_dirty = False
+        
+        # Telemetri hızından bağımsız olarak en fazla ~60 Hz kare iste
+        self._dirty = False
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+        
+        # Thread widget'ın çocuğu değil: widget (ör. container yeniden kurulurken) silinirse
+        # çalışan bir QThread yok edilmesin; destroyed'da durdurulur (closure self'i tutmaz)
+        self._render_thread = QThread()
+        self._renderer = HUDRenderer()
+        self._renderer.moveToThread(self._render_thread)
+        self.render_requested.connect(self._renderer.render)
+        self._renderer.frame_ready.connect(self._on_frame_ready)
+        self._render_thread.finished.connect(self._renderer.deleteLater)
+        self._render_thread.start()
+        self.destroyed.connect(lambda *_, t=self._render_thread: (t.quit(), t.wait()))
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_rendering)
+    """def updateData(self, data: dict):
+        super().updateData(data)
+    """
+    """def setConnectionState(self, connected: bool):
+        super().setConnectionState(connected)
+    """
+    
+    def updateData(self, data: dict):
+        """
+        HUD’un internal _data sözlüğünü günceller ve
+        bir sonraki yeniden çizimi zamanlar.
+        """
+        self._data.update(data)
+        self._schedule_repaint()
+
+    def setConnectionState(self, connected: bool):
+        """
+        Bağlantı durumunu HUD içindeki flag’e yazar
+        ve yeniden çizer.
+        """
+        self._isConnected = connected
+        self._schedule_repaint()
+    
+    def update_flight_data(self, data: dict):
+        """
+        data içindeki alanları field_mapping üzerinden
+        HUD’in internal _data sözlüğüne map’ler ve updateData()’yı çağırır.
+        """
+        field_mapping = {
+            'roll': 'roll',
+            'pitch': 'pitch', 
+            'yaw': 'yaw',
+            'airspeed': 'airspeed',
+            'groundspeed': 'groundspeed',
+            'altitude': 'altitude',
+            'throttle': 'throttle',
+            'batteryLevel': 'batteryLevel',
+            'batteryVoltage': 'batteryVoltage',
+            'batteryCurrent': 'batteryCurrent',
+            'armed': 'armed',
+            'armable': 'armable',
+            'flightMode': 'flightMode',
+            'gpsStatus': 'gpsStatus',
+            'gpsSatellites': 'gpsSatellites',
+            'waypointDist': 'waypointDist',
+            'targetBearing': 'targetBearing'
+        }
+        
+        mapped = {}
+        for src, dst in field_mapping.items():
+            if src in data:
+                mapped[dst] = data[src]        
+        self.updateData(mapped)
+
+    def set_connection_status(self, connected: bool):
+        """Bağlantı durumunu HUD’e bildirir."""
+        self.setConnectionState(connected)
+        
+    def _schedule_repaint(self):
+        """
+        Yeniden çizimi işaretler; aynı 16 ms aralığında gelen
+        güncellemeler tek bir kareye birleştirilir.
+        """
+        self._dirty = True
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_repaint(self):
+        """Zamanlayıcı dolduğunda bekleyen güncelleme varsa kare ister."""
+        if self._dirty:
+            self._dirty = False
+            self._request_render()
+
+    def _request_render(self):
+        """
+        Çizim iş parçacığından yeni bir kare ister. Bir kare zaten
+        çiziliyorsa istek birleştirilir ve kare hazır olduğunda gönderilir.
+        """
+        if self._render_pending:
+            self._render_dirty = True
+            return
+        self._render_pending = True
+        self._render_dirty = False
+        self.render_requested.emit(self.size(), dict(self._data), self._isConnected)
+
+    def _on_frame_ready(self, image: QImage):
+        """Çizim iş parçacığından gelen kareyi saklar ve yeniden çizer."""
+        with QMutexLocker(self._frame_mutex):
+            self._last_frame = image
+        self._render_pending = False
+        self.update()
+        if self._render_dirty:
+            self._request_render()
+
+    def stop_rendering(self):
+        """Çizim iş parçacığını durdurur."""
+        self._repaint_timer.stop()
+        if self._render_thread.isRunning():
+            self._render_thread.quit()
+            self._render_thread.wait()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        
+        with QMutexLocker(self._frame_mutex):
+            frame = self._last_frame
+        
+        # Kare henüz yoksa veya boyut değişmişse açıkta kalan alanı siyahla doldur
+        if frame.size() != self.size():
+            p.fillRect(event.rect(), QColor(0, 0, 0))
+        if not frame.isNull():
+            p.drawImage(0, 0, frame)
+        
+        p.end()
+        
     # Uyumluluk metodları
     def update_flight_data(self, data: dict):
         """Uçuş verilerini güncelle"""
@@ -645,12 +834,13 @@ class HUDWidget(QWidget):
     def showEvent(self, event):
         """Widget gösterildiğinde"""
         super().showEvent(event)
-        print(f"HUD Widget shown - size: {self.size()}")
+        logger.debug("HUD widget shown - size: %dx%d", self.width(), self.height())
 
     def resizeEvent(self, event):
         """Widget boyutu değiştiğinde"""
         super().resizeEvent(event)
-        print(f"HUD Widget resized to: {self.size()}")
+        self._schedule_repaint()
+        logger.debug("HUD widget resized to: %dx%d", self.width(), self.height())
 
     def update_attitude(self, roll: float, pitch: float, yaw: float):
         """Attitude verilerini güncelle"""
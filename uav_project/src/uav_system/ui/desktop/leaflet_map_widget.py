@@ -3,17 +3,108 @@ Leaflet Online Map Widget for UAV Ground Control Station
 Provides interactive online map display with UAV tracking using Leaflet.js
 """
 
-import json
+import logging
 import os
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget
-from PyQt5.QtCore import QTimer, pyqtSignal, QUrl, pyqtSlot, Qt
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEngineProfile
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget, QButtonGroup
+from PyQt5.QtCore import QFile, QIODevice, QObject, QTimer, pyqtSignal, QUrl, pyqtSlot, Qt
+from PyQt5.QtWebEngineWidgets import (QWebEngineView, QWebEngineSettings, QWebEngineProfile, QWebEnginePage,
+                                      QWebEngineScript)
+from PyQt5.QtWebChannel import QWebChannel
 from ...core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Named (disk-backed) profile shared by all map views so tiles survive restarts
+LEAFLET_CACHE_DIR = Path.home() / ".cache" / "uav_leaflet"
+LEAFLET_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Static Leaflet page shipped with the package; the initial view is passed in the URL query
+LEAFLET_HTML_PATH = Path(__file__).parent / "resources" / "leaflet_map.html"
+_leaflet_profile = None
+
+
+def get_leaflet_profile() -> QWebEngineProfile:
+    """Return the persistent WebEngine profile for the Leaflet map (created on first use)."""
+    global _leaflet_profile
+    if _leaflet_profile is None:
+        _leaflet_profile = QWebEngineProfile("uav_leaflet", None)
+        _leaflet_profile.setCachePath(str(LEAFLET_CACHE_DIR))
+        _leaflet_profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+        _leaflet_profile.setHttpCacheMaximumSize(LEAFLET_CACHE_MAX_BYTES)
+        # Tile sunucusu çerezleri ve storage da aynı dizinde kalsın (yeniden doğrulama istekleri için)
+        _leaflet_profile.setPersistentStoragePath(str(LEAFLET_CACHE_DIR / "storage"))
+        _leaflet_profile.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+    return _leaflet_profile
+
+
+# Packed position: (lat + 90) * 1e5 above (lon + 180) * 1e5 in the low 26 bits.
+# 51 bits total, so it stays an exact JavaScript Number (53-bit safe integer).
+POSITION_LON_BITS = 26
+
+
+def pack_position(lat: float, lon: float) -> int:
+    """Pack a lat/lon pair (1e-5 deg resolution) into a single integer."""
+    return (round((lat + 90) * 1e5) << POSITION_LON_BITS) | round((lon + 180) * 1e5)
+
+
+def create_webchannel_script() -> Optional[QWebEngineScript]:
+    """Return Qt's qwebchannel.js as a script injected before the page's own scripts."""
+    source_file = QFile(":/qtwebchannel/qwebchannel.js")
+    if not source_file.open(QIODevice.ReadOnly):
+        logger.warning("qwebchannel.js not found in Qt resources")
+        return None
+    source = bytes(source_file.readAll()).decode('utf-8')
+    source_file.close()
+    
+    script = QWebEngineScript()
+    script.setName("qwebchannel")
+    script.setSourceCode(source)
+    script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+    script.setWorldId(QWebEngineScript.MainWorld)
+    script.setRunsOnSubFrames(False)
+    return script
+
+
+class UAVBridge(QObject):
+    """QWebChannel object used to push typed map updates to JavaScript."""
+    
+    # Signals (delivered to JavaScript listeners)
+    positionsChanged = pyqtSignal('QVariantList')  # [packed_position, heading_deci, ...]
+    layerChanged = pyqtSignal(str)  # 'street' or 'satellite'
+    flightPathToggled = pyqtSignal(bool)  # visible
+    flightPathCleared = pyqtSignal()
+    centerOnUAVRequested = pyqtSignal()
+    mapCenterChanged = pyqtSignal(float, float, int)  # lat, lon, zoom (0 = keep zoom)
+    resizeRequested = pyqtSignal()
+    waypointsAdded = pyqtSignal('QVariantList')  # [{'id', 'lat', 'lon', 'name'}, ...]
+    waypointRemoved = pyqtSignal(str)  # waypoint_id
+    
+    # Signals (Python side)
+    ready = pyqtSignal()  # Leaflet map initialized in the page
+    
+    @pyqtSlot()
+    def mapReady(self):
+        """Called from JavaScript when Leaflet's map.whenReady fires."""
+        self.ready.emit()
+
+
+class OfflineMapBridge(QObject):
+    """QWebChannel object for the offline map page (resources/offline_map.html)."""
+    
+    # Signals (delivered to JavaScript listeners)
+    telemetryChanged = pyqtSignal(float, float, float, float, float)  # lat, lon, alt, heading, battery
+    
+    # Signals (Python side)
+    ready = pyqtSignal()  # page connected to the channel
+    
+    @pyqtSlot()
+    def pageReady(self):
+        """Called from JavaScript once the page listens to telemetryChanged."""
+        self.ready.emit()
+
 
 class LeafletOnlineMap(QWidget):
     """Interactive online map widget using Leaflet.js for smooth rendering."""
@@ -35,8 +126,35 @@ class LeafletOnlineMap(QWidget):
         
         # UAV tracking
         self.uav_position = None
-        self.uav_track = []
         self.max_track_points = 1000
+        self.uav_track = deque(maxlen=self.max_track_points)
+        
+        # Position updates are queued and pushed to JavaScript in batches
+        self._pending_positions = deque(maxlen=64)
+        self._last_queued_sample = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self.flush_pending_updates)
+        
+        # Resize/show events are coalesced into one map resize
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self.force_map_resize)
+        
+        # Single load timeout, restarted for every (re)load of the page
+        self.load_timeout = QTimer(self)
+        self.load_timeout.setSingleShot(True)
+        self.load_timeout.setInterval(15000)  # 15 second timeout for online map
+        self.load_timeout.timeout.connect(self.on_load_timeout)
+        
+        # Coordinate label is refreshed at most 5 times per second
+        self._pending_coords = None
+        self._coords_timer = QTimer(self)
+        self._coords_timer.setSingleShot(True)
+        self._coords_timer.setInterval(200)
+        self._coords_timer.timeout.connect(self._refresh_coords_label)
         
         # Waypoints and missions
         self.waypoints = {}
@@ -49,8 +167,11 @@ class LeafletOnlineMap(QWidget):
         
         # Web view
         self.web_view = None
+        self._page = None  # Cached web_view.page(); the page object lives as long as the view
         self.loading_label = None
         self.map_stack = None
+        self._last_coord_str = ""
+        self._map_setup_done = False  # setup_map runs on first show
         
         # Remove widget margins and padding
         self.setContentsMargins(0, 0, 0, 0)
@@ -63,7 +184,6 @@ class LeafletOnlineMap(QWidget):
         """)
         
         self.setup_ui()
-        self.setup_map()
         
         logger.info("Leaflet Online Map Widget initialized")
     
@@ -83,16 +203,21 @@ class LeafletOnlineMap(QWidget):
         self.btn_street.setChecked(True)
         self.btn_street.setMaximumSize(40, 25)
         self.btn_street.setToolTip("Street Map")
-        self.btn_street.clicked.connect(self.toggle_street_layer)
         control_layout.addWidget(self.btn_street)
         
         self.btn_satellite = QPushButton("🛰️")
         self.btn_satellite.setCheckable(True)
         self.btn_satellite.setMaximumSize(40, 25)
         self.btn_satellite.setToolTip("Satellite View")
-        self.btn_satellite.clicked.connect(self.toggle_satellite_layer)
         control_layout.addWidget(self.btn_satellite)
         
+        # Street/satellite exclusivity is enforced by Qt
+        self.layer_buttons = QButtonGroup(self)
+        self.layer_buttons.setExclusive(True)
+        self.layer_buttons.addButton(self.btn_street)
+        self.layer_buttons.addButton(self.btn_satellite)
+        self.layer_buttons.buttonClicked.connect(self.on_layer_button_clicked)
+        
         # Flight path toggle
         self.btn_flight_path = QPushButton("✈️")
         self.btn_flight_path.setCheckable(True)
@@ -159,6 +284,9 @@ class LeafletOnlineMap(QWidget):
         
         # Web engine view for map - maximum space
         self.web_view = QWebEngineView()
+        # Page on the persistent profile: Chromium's disk cache serves tiles on later launches
+        self._page = QWebEnginePage(get_leaflet_profile(), self.web_view)
+        self.web_view.setPage(self._page)
         self.web_view.setMinimumSize(600, 400)  # Increased minimum size
         self.web_view.setSizePolicy(self.web_view.sizePolicy().Expanding, self.web_view.sizePolicy().Expanding)
         
@@ -179,13 +307,27 @@ class LeafletOnlineMap(QWidget):
         """)
         self.loading_label.setVisible(True)
         
+        # Typed Python -> JavaScript bridge for high-rate map updates
+        self.bridge = UAVBridge(self)
+        self.channel = QWebChannel(self._page)
+        self.channel.registerObject("uav", self.bridge)
+        self._page.setWebChannel(self.channel)
+        # QWebChannel JS client is injected once per page (survives reloads)
+        webchannel_script = create_webchannel_script()
+        if webchannel_script is not None:
+            self._page.scripts().insert(webchannel_script)
+        self.bridge.ready.connect(self.on_js_map_ready)
+        
         # Configure web engine settings for better performance
         settings = self.web_view.settings()
         settings.setAttribute(QWebEngineSettings.JavascriptEnabled, True)
         settings.setAttribute(QWebEngineSettings.LocalContentCanAccessRemoteUrls, True)
         settings.setAttribute(QWebEngineSettings.LocalContentCanAccessFileUrls, True)
-        settings.setAttribute(QWebEngineSettings.ErrorPageEnabled, True)
-        settings.setAttribute(QWebEngineSettings.PluginsEnabled, True)
+        settings.setAttribute(QWebEngineSettings.ErrorPageEnabled, False)  # We show our own error overlay
+        settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)  # No plugins on the map page
+        settings.setAttribute(QWebEngineSettings.Accelerated2dCanvasEnabled, True)
+        settings.setAttribute(QWebEngineSettings.WebGLEnabled, True)
+        settings.setAttribute(QWebEngineSettings.ScrollAnimatorEnabled, False)
         settings.setAttribute(QWebEngineSettings.AllowGeolocationOnInsecureOrigins, True)
         settings.setAttribute(QWebEngineSettings.ShowScrollBars, False)  # Hide scrollbars
         
@@ -211,50 +353,24 @@ class LeafletOnlineMap(QWidget):
     def setup_map(self):
         """Initialize the Leaflet-based online map."""
         try:
-            self.loading_label.setText("🔗 Leaflet HTML dosyası oluşturuluyor...")
-            
-            # Create map HTML
-            map_html = self.create_leaflet_html()
-            
-            # Save to temporary file
-            map_file_path = Path(__file__).parent / "resources" / "leaflet_map.html"
-            map_file_path.parent.mkdir(exist_ok=True)
-            
-            with open(map_file_path, 'w', encoding='utf-8') as f:
-                f.write(map_html)
+            map_file_path = LEAFLET_HTML_PATH
+            if not map_file_path.exists():
+                raise FileNotFoundError(f"Leaflet map page not found: {map_file_path}")
             
             self.loading_label.setText("🌐 Online harita yükleniyor...")
             
             # Load map with error handling
             self.web_view.loadFinished.connect(self.on_map_loaded)
             
-            # Set up page load error handling
-            def on_load_error():
-                logger.error("Leaflet map failed to load")
-                self.loading_label.setText("❌ Harita yükleme hatası!\n\nİnternet bağlantınızı kontrol edin\nveya uygulamayı yeniden başlatın.")
-                self.loading_label.setStyleSheet("""
-                    QLabel {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #e74c3c, stop:1 #c0392b);
-                        color: white;
-                        font-size: 14px;
-                        font-weight: bold;
-                        padding: 20px;
-                        border-radius: 10px;
-                    }
-                """)
-            
-            # Set timeout for loading
-            self.load_timeout = QTimer()
-            self.load_timeout.timeout.connect(on_load_error)
-            self.load_timeout.setSingleShot(True)
-            self.load_timeout.start(15000)  # 15 second timeout for online map
+            # Show an error if Leaflet is not ready in time
+            self.load_timeout.start()
             
-            # Load map
+            # Load map; the initial view travels in the query string
             file_url = QUrl.fromLocalFile(str(map_file_path.absolute()))
+            file_url.setQuery(f"lat={self.current_lat}&lon={self.current_lon}&zoom={self.zoom_level}")
             self.web_view.load(file_url)
             
-            logger.info(f"Leaflet map HTML created at: {map_file_path}")
+            logger.info(f"Leaflet map HTML: {map_file_path}")
             logger.info(f"Loading map from URL: {file_url.toString()}")
             
         except Exception as e:
@@ -270,483 +386,13 @@ class LeafletOnlineMap(QWidget):
                 }
             """)
     
-    def create_leaflet_html(self) -> str:
-        """Create the HTML content for Leaflet online map."""
-        html_template = f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Hüma UAV - Leaflet Map</title>
-            <meta charset="utf-8" />
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            
-            <!-- Leaflet CSS -->
-            <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css"
-                integrity="sha256-p4NxAoJBhIIN+hmNHrzRCf9tD/miZyoHS5obTRR9BMY="
-                crossorigin=""/>
-            
-            <!-- Leaflet JavaScript -->
-            <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"
-                integrity="sha256-20nQCchB9co0qIjJZRGuk2/Z9VM+kNiyxNV1lvTlZBo="
-                crossorigin=""></script>
-            
-            <style>
-                html, body {{
-                    margin: 0;
-                    padding: 0;
-                    height: 100%;
-                    width: 100%;
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    overflow: hidden;
-                }}
-                #map {{
-                    height: 100vh;
-                    width: 100vw;
-                    position: absolute;
-                    top: 0;
-                    left: 0;
-                    z-index: 1;
-                }}
-                .custom-div-icon {{
-                    background: none;
-                    border: none;
-                }}
-                .uav-marker {{
-                    width: 30px;
-                    height: 30px;
-                    background: #e74c3c;
-                    border: 3px solid white;
-                    border-radius: 50%;
-                    box-shadow: 0 0 15px rgba(231, 76, 60, 0.6);
-                    animation: pulse 2s infinite;
-                }}
-                @keyframes pulse {{
-                    0% {{ box-shadow: 0 0 0 0 rgba(231, 76, 60, 0.7); }}
-                    70% {{ box-shadow: 0 0 0 20px rgba(231, 76, 60, 0); }}
-                    100% {{ box-shadow: 0 0 0 0 rgba(231, 76, 60, 0); }}
-                }}
-                .waypoint-marker {{
-                    width: 20px;
-                    height: 20px;
-                    background: #3498db;
-                    border: 2px solid white;
-                    border-radius: 50%;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.3);
-                }}
-                .heading-arrow {{
-                    background: none;
-                    border: none;
-                    pointer-events: none;
-                }}
-                .info-panel {{
-                    position: absolute;
-                    top: 10px;
-                    right: 10px;
-                    background: rgba(44, 62, 80, 0.9);
-                    color: white;
-                    padding: 10px;
-                    border-radius: 8px;
-                    z-index: 1000;
-                    font-size: 12px;
-                    min-width: 200px;
-                }}
-                .loading-overlay {{
-                    position: absolute;
-                    top: 50%;
-                    left: 50%;
-                    transform: translate(-50%, -50%);
-                    background: rgba(52, 152, 219, 0.9);
-                    color: white;
-                    padding: 20px 30px;
-                    border-radius: 10px;
-                    z-index: 2000;
-                    font-size: 16px;
-                    font-weight: bold;
-                    display: none;
-                }}
-            </style>
-        </head>
-        <body onload="initMap()">
-            <div id="map"></div>
-            <div class="info-panel" id="infoPanel">
-                <div><strong>🗺️ Leaflet Online Map</strong></div>
-                <div>Zoom: <span id="zoomLevel">{self.zoom_level}</span></div>
-                <div>Center: <span id="mapCenter">{self.current_lat:.4f}, {self.current_lon:.4f}</span></div>
-                <div>UAV: <span id="uavStatus">Bağlantı bekleniyor</span></div>
-            </div>
-            <div class="loading-overlay" id="loadingOverlay">
-                🌐 Harita yükleniyor...
-            </div>
-            
-            <script>
-                var map;
-                var uavMarker;
-                var flightPath = [];
-                var flightPolyline;
-                var headingLine;
-                var headingArrow;
-                var waypoints = {{}};
-                var streetLayer, satelliteLayer;
-                var currentLayer = 'street';
-                
-                function initMap() {{
-                    try {{
-                        console.log('Initializing Leaflet map...');
-                        
-                        // Show loading
-                        document.getElementById('loadingOverlay').style.display = 'block';
-                        
-                        // Initialize map
-                        map = L.map('map', {{
-                            center: [{self.current_lat}, {self.current_lon}],
-                            zoom: {self.zoom_level},
-                            zoomControl: true,
-                            scrollWheelZoom: true,
-                            doubleClickZoom: true,
-                            dragging: true
-                        }});
-                        
-                        // Define tile layers
-                        streetLayer = L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
-                            attribution: '© OpenStreetMap contributors',
-                            maxZoom: 19
-                        }});
-                        
-                        satelliteLayer = L.tileLayer('https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{{z}}/{{y}}/{{x}}', {{
-                            attribution: '© Esri, Maxar, Earthstar Geographics',
-                            maxZoom: 19
-                        }});
-                        
-                        // Add default layer
-                        streetLayer.addTo(map);
-                        
-                        // Initialize flight path (disabled by default)
-                        flightPolyline = L.polyline([], {{
-                            color: '#e74c3c',
-                            weight: 3,
-                            opacity: 0.8
-                        }});
-                        
-                        // Map event listeners
-                        map.on('click', function(e) {{
-                            var lat = e.latlng.lat.toFixed(6);
-                            var lng = e.latlng.lng.toFixed(6);
-                            console.log('Map clicked at:', lat, lng);
-                            
-                            // Update center display
-                            document.getElementById('mapCenter').textContent = lat + ', ' + lng;
-                            
-                            // Create temporary click marker
-                            var clickMarker = L.circleMarker([e.latlng.lat, e.latlng.lng], {{
-                                color: '#f1c40f',
-                                fillColor: '#f39c12',
-                                fillOpacity: 0.8,
-                                radius: 8
-                            }}).addTo(map);
-                            
-                            setTimeout(function() {{
-                                map.removeLayer(clickMarker);
-                            }}, 2000);
-                        }});
-                        
-                        map.on('zoomend', function() {{
-                            document.getElementById('zoomLevel').textContent = map.getZoom();
-                        }});
-                        
-                        map.on('moveend', function() {{
-                            var center = map.getCenter();
-                            document.getElementById('mapCenter').textContent = 
-                                center.lat.toFixed(4) + ', ' + center.lng.toFixed(4);
-                        }});
-                        
-                        // Handle resize
-                        function onResize() {{
-                            console.log('Map resize triggered');
-                            setTimeout(function() {{
-                                if (map) {{
-                                    map.invalidateSize();
-                                }}
-                            }}, 100);
-                        }}
-                        
-                        window.addEventListener('resize', onResize);
-                        
-                        // Hide loading after initialization
-                        setTimeout(function() {{
-                            document.getElementById('loadingOverlay').style.display = 'none';
-                            console.log('Leaflet map initialized successfully');
-                        }}, 1000);
-                        
-                    }} catch (error) {{
-                        console.error('Error initializing map:', error);
-                        document.getElementById('loadingOverlay').innerHTML = 
-                            '❌ Harita başlatma hatası<br>' + error.message;
-                    }}
-                }}
-                
-                // Functions callable from Qt
-                window.updateUAVPosition = function(lat, lon, heading) {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet, deferring UAV position update');
-                            setTimeout(function() {{
-                                updateUAVPosition(lat, lon, heading);
-                            }}, 1000);
-                            return;
-                        }}
-                        
-                        console.log('Updating UAV position:', lat, lon, heading);
-                        
-                        // Remove existing UAV marker and heading line
-                        if (uavMarker) {{
-                            map.removeLayer(uavMarker);
-                        }}
-                        if (headingLine) {{
-                            map.removeLayer(headingLine);
-                        }}
-                        if (headingArrow) {{
-                            map.removeLayer(headingArrow);
-                        }}
-                        
-                        // Create UAV marker
-                        var uavIcon = L.divIcon({{
-                            className: 'custom-div-icon',
-                            html: '<div class="uav-marker"></div>',
-                            iconSize: [30, 30],
-                            iconAnchor: [15, 15]
-                        }});
-                        
-                        uavMarker = L.marker([lat, lon], {{icon: uavIcon}})
-                            .addTo(map)
-                            .bindPopup('🚁 UAV<br>Lat: ' + lat.toFixed(6) + '<br>Lon: ' + lon.toFixed(6) + '<br>Heading: ' + heading.toFixed(1) + '°');
-                        
-                        // Create heading line
-                        var headingDistance = 0.001;
-                        var headingRad = (heading * Math.PI) / 180;
-                        var headingEndLat = lat + (headingDistance * Math.cos(headingRad));
-                        var headingEndLon = lon + (headingDistance * Math.sin(headingRad));
-                        
-                        headingLine = L.polyline([
-                            [lat, lon],
-                            [headingEndLat, headingEndLon]
-                        ], {{
-                            color: '#ff6b35',
-                            weight: 4,
-                            opacity: 0.9
-                        }}).addTo(map);
-                        
-                        // Add to flight path
-                        flightPath.push([lat, lon]);
-                        if (flightPath.length > 1000) {{
-                            flightPath.shift();
-                        }}
-                        
-                        // Update flight path polyline
-                        if (flightPolyline) {{
-                            flightPolyline.setLatLngs(flightPath);
-                        }}
-                        
-                        // Update status
-                        var statusElement = document.getElementById('uavStatus');
-                        if (statusElement) {{
-                            statusElement.textContent = lat.toFixed(4) + ', ' + lon.toFixed(4);
-                        }}
-                        
-                    }} catch (error) {{
-                        console.error('Error updating UAV position:', error);
-                    }}
-                }};
-                
-                window.centerOnUAV = function() {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet');
-                            return;
-                        }}
-                        if (uavMarker) {{
-                            map.setView(uavMarker.getLatLng(), map.getZoom());
-                            console.log('Map centered on UAV');
-                        }}
-                    }} catch (error) {{
-                        console.error('Error centering on UAV:', error);
-                    }}
-                }};
-                
-                window.clearFlightPath = function() {{
-                    try {{
-                        flightPath = [];
-                        if (flightPolyline) {{
-                            flightPolyline.setLatLngs([]);
-                        }}
-                        console.log('Flight path cleared');
-                    }} catch (error) {{
-                        console.error('Error clearing flight path:', error);
-                    }}
-                }};
-                
-                window.addWaypoint = function(lat, lon, name, id) {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet, deferring waypoint addition');
-                            setTimeout(function() {{
-                                addWaypoint(lat, lon, name, id);
-                            }}, 1000);
-                            return;
-                        }}
-                        
-                        var waypointIcon = L.divIcon({{
-                            className: 'custom-div-icon',
-                            html: '<div class="waypoint-marker"></div>',
-                            iconSize: [20, 20],
-                            iconAnchor: [10, 10]
-                        }});
-                        
-                        var marker = L.marker([lat, lon], {{icon: waypointIcon}})
-                            .addTo(map)
-                            .bindPopup('📍 ' + name + '<br>Lat: ' + lat.toFixed(6) + '<br>Lon: ' + lon.toFixed(6));
-                        
-                        waypoints[id] = marker;
-                        console.log('Waypoint added:', id, name);
-                        
-                    }} catch (error) {{
-                        console.error('Error adding waypoint:', error);
-                    }}
-                }};
-                
-                window.removeWaypoint = function(id) {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet');
-                            return;
-                        }}
-                        if (waypoints[id]) {{
-                            map.removeLayer(waypoints[id]);
-                            delete waypoints[id];
-                            console.log('Waypoint removed:', id);
-                        }}
-                    }} catch (error) {{
-                        console.error('Error removing waypoint:', error);
-                    }}
-                }};
-                
-                window.setMapCenter = function(lat, lon, zoom) {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet');
-                            return;
-                        }}
-                        if (zoom) {{
-                            map.setView([lat, lon], zoom);
-                        }} else {{
-                            map.setView([lat, lon]);
-                        }}
-                    }} catch (error) {{
-                        console.error('Error setting map center:', error);
-                    }}
-                }};
-                
-                window.toggleSatelliteLayer = function() {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet');
-                            return;
-                        }}
-                        if (currentLayer === 'street') {{
-                            map.removeLayer(streetLayer);
-                            satelliteLayer.addTo(map);
-                            currentLayer = 'satellite';
-                            console.log('Switched to satellite layer');
-                        }} else {{
-                            map.removeLayer(satelliteLayer);
-                            streetLayer.addTo(map);
-                            currentLayer = 'street';
-                            console.log('Switched to street layer');
-                        }}
-                    }} catch (error) {{
-                        console.error('Error toggling satellite layer:', error);
-                    }}
-                }};
-                
-                window.toggleFlightPath = function(show) {{
-                    try {{
-                        if (!map) {{
-                            console.log('Map not initialized yet');
-                            return;
-                        }}
-                        if (show) {{
-                            flightPolyline.addTo(map);
-                        }} else {{
-                            map.removeLayer(flightPolyline);
-                        }}
-                    }} catch (error) {{
-                        console.error('Error toggling flight path:', error);
-                    }}
-                }};
-                
-                // Force map resize
-                window.forceResize = function() {{
-                    try {{
-                        if (map) {{
-                            setTimeout(function() {{
-                                map.invalidateSize();
-                                console.log('Map size invalidated');
-                            }}, 100);
-                        }}
-                    }} catch (error) {{
-                        console.error('Error forcing resize:', error);
-                    }}
-                }};
-                
-                // Add test data after initialization
-                setTimeout(function() {{
-                    try {{
-                        if (typeof updateUAVPosition === 'function') {{
-                            updateUAVPosition({self.current_lat}, {self.current_lon}, 45);
-                            addWaypoint({self.current_lat + 0.001}, {self.current_lon + 0.001}, 'Test Waypoint', 'test_wp_1');
-                        }}
-                    }} catch (error) {{
-                        console.error('Error adding test data:', error);
-                    }}
-                }}, 2000);
-                
-            </script>
-        </body>
-        </html>
-        '''
-        
-        return html_template
-    
     def on_map_loaded(self, success: bool):
-        """Handle map load completion."""
-        # Stop the timeout timer
-        if hasattr(self, 'load_timeout'):
-            self.load_timeout.stop()
-        
+        """Handle page load completion; the map is shown on the bridge's ready call."""
         if success:
-            self.map_loaded = True
-            logger.info("Leaflet map loaded successfully")
-            
-            # Wait for JavaScript initialization and immediately switch to map
-            def switch_to_map():
-                self.map_stack.setCurrentWidget(self.web_view)
-                # Force map resize and invalidation after switching
-                QTimer.singleShot(500, self.force_map_resize)
-                QTimer.singleShot(1000, self.force_map_resize)  # Extra resize after 1 second
-                logger.info("Switched to Leaflet map view")
-                self.map_ready.emit(True)
-            
-            # Check if JavaScript is working
-            def check_js_functionality():
-                self.web_view.page().runJavaScript(
-                    "typeof window.updateUAVPosition !== 'undefined'",
-                    self.on_js_check_complete
-                )
-            
-            # Immediate switch to reduce loading time
-            QTimer.singleShot(1000, check_js_functionality)
-            QTimer.singleShot(1500, switch_to_map)
-            
+            # The load timeout keeps running until Leaflet reports ready
+            logger.info("Leaflet page loaded, waiting for map initialization")
         else:
+            self.load_timeout.stop()
             logger.error("Failed to load Leaflet map")
             self.loading_label.setText("❌ Harita yükleniyor...")
             self.loading_label.setStyleSheet("""
@@ -762,78 +408,69 @@ class LeafletOnlineMap(QWidget):
             """)
             self.map_ready.emit(False)
     
+    @pyqtSlot()
+    def on_load_timeout(self):
+        """Show the error overlay when the map did not become ready in time."""
+        logger.error("Leaflet map failed to load")
+        self.loading_label.setText("❌ Harita yükleme hatası!\n\nİnternet bağlantınızı kontrol edin\nveya uygulamayı yeniden başlatın.")
+        self.loading_label.setStyleSheet("""
+            QLabel {
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #e74c3c, stop:1 #c0392b);
+                color: white;
+                font-size: 14px;
+                font-weight: bold;
+                padding: 20px;
+                border-radius: 10px;
+            }
+        """)
+    
+    @pyqtSlot()
+    def on_js_map_ready(self):
+        """Switch to the map as soon as Leaflet is initialized in the page."""
+        self.load_timeout.stop()
+        self.map_loaded = True
+        self._last_queued_sample = None  # fresh page: resend even an unchanged position
+        self.map_stack.setCurrentWidget(self.web_view)
+        self.force_map_resize()
+        logger.info("Leaflet map ready, switched to map view")
+        self.map_ready.emit(True)
+    
     def force_map_resize(self):
         """Force map to resize and redraw properly."""
         if self.map_loaded and self.web_view:
-            resize_js = """
-                try {
-                    if (typeof map !== 'undefined' && map) {
-                        setTimeout(function() {
-                            map.invalidateSize(true);
-                            map.getContainer().style.height = '100%';
-                            map.getContainer().style.width = '100%';
-                            console.log('Map resize triggered');
-                        }, 100);
-                    }
-                } catch (error) {
-                    console.error('Error in force resize:', error);
-                }
-            """
-            self.web_view.page().runJavaScript(resize_js)
-    
-    def on_js_check_complete(self, result):
-        """Handle JavaScript functionality check result."""
-        if result:
-            logger.info("JavaScript functions are working correctly")
-        else:
-            logger.warning("JavaScript functions not available - map may not work correctly")
+            self.bridge.resizeRequested.emit()
     
-    @pyqtSlot()
-    def toggle_satellite_layer(self):
-        """Toggle satellite layer."""
-        self.show_satellite = self.btn_satellite.isChecked()
-        if self.btn_satellite.isChecked():
-            self.btn_street.setChecked(False)
-        else:
-            self.btn_street.setChecked(True)
-            
-        if self.map_loaded:
-            self.web_view.page().runJavaScript("toggleSatelliteLayer()")
+    def on_layer_button_clicked(self, button):
+        """Switch to the layer of the clicked street/satellite button."""
+        self.show_satellite = button is self.btn_satellite
+        self._apply_map_layer()
     
-    @pyqtSlot()
-    def toggle_street_layer(self):
-        """Toggle street layer."""
-        if self.btn_street.isChecked():
-            self.btn_satellite.setChecked(False)
-            self.show_satellite = False
-        else:
-            self.btn_satellite.setChecked(True)
-            self.show_satellite = True
-            
+    def _apply_map_layer(self):
+        """Show the layer selected by the buttons (no-op in JS if already shown)."""
         if self.map_loaded:
-            self.web_view.page().runJavaScript("toggleSatelliteLayer()")
+            self.bridge.layerChanged.emit('satellite' if self.show_satellite else 'street')
     
     @pyqtSlot()
     def toggle_flight_path(self):
         """Toggle flight path visibility."""
         self.show_flight_path = self.btn_flight_path.isChecked()
         if self.map_loaded:
-            show = "true" if self.show_flight_path else "false"
-            self.web_view.page().runJavaScript(f"toggleFlightPath({show})")
+            self.bridge.flightPathToggled.emit(self.show_flight_path)
     
     @pyqtSlot()
     def clear_track(self):
         """Clear the UAV flight track."""
         self.uav_track.clear()
         if self.map_loaded:
-            self.web_view.page().runJavaScript("clearFlightPath()")
+            self.bridge.flightPathCleared.emit()
         logger.info("Flight track cleared")
     
     @pyqtSlot()
     def center_on_uav(self):
         """Center map on UAV position."""
         if self.map_loaded and self.uav_position:
-            self.web_view.page().runJavaScript("centerOnUAV()")
+            self.bridge.centerOnUAVRequested.emit()
             logger.info("Map centered on UAV")
     
     def update_uav_position(self, lat: float, lon: float, heading: float = 0):
@@ -841,50 +478,92 @@ class LeafletOnlineMap(QWidget):
         try:
             self.uav_position = {'lat': lat, 'lon': lon, 'heading': heading}
             
-            # Add to track
-            self.uav_track.append((lat, lon))
-            if len(self.uav_track) > self.max_track_points:
-                self.uav_track.pop(0)
+            # Add to track (5 decimals ~ 1.1 m, plenty for the map);
+            # the deque drops the oldest point once full
+            self.uav_track.append((round(lat, 5), round(lon, 5)))
             
             # Update coordinates display
-            self.lbl_coordinates.setText(f"📍 Lat: {lat:.6f}, Lon: {lon:.6f}")
+            self._set_coords(lat, lon)
             
-            # Update map if loaded
+            # Queue for the next batched map update; repeated samples (hovering,
+            # telemetry faster than the 1e-5 deg resolution) are coalesced
             if self.map_loaded:
-                self.web_view.page().runJavaScript(
-                    f"updateUAVPosition({lat}, {lon}, {heading})"
-                )
+                sample = (pack_position(lat, lon), round(heading * 10) % 3600)
+                if sample == self._last_queued_sample:
+                    return
+                self._last_queued_sample = sample
+                self._pending_positions.append(sample)
+                if not self._flush_timer.isActive():
+                    self._flush_timer.start()
             
-            logger.debug(f"UAV position updated: {lat:.6f}, {lon:.6f}, heading: {heading:.1f}°")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UAV position updated: %.6f, %.6f, heading: %.1f°", lat, lon, heading)
             
         except Exception as e:
             logger.error(f"Error updating UAV position: {e}")
     
+    def _set_coords(self, lat: float, lon: float):
+        """Schedule a coordinate label refresh with the latest position."""
+        self._pending_coords = (lat, lon)
+        if not self._coords_timer.isActive():
+            self._coords_timer.start()
+    
+    def _refresh_coords_label(self):
+        """Update the coordinate label, skipping the repaint when the text is unchanged."""
+        lat, lon = self._pending_coords
+        text = f"📍 {lat:.4f}, {lon:.4f}"
+        if text != self._last_coord_str:
+            self.lbl_coordinates.setText(text)
+            self._last_coord_str = text
+    
+    def flush_pending_updates(self):
+        """Push queued UAV positions to the map through the web channel."""
+        if not self._pending_positions:
+            return
+        
+        batch = [value for sample in self._pending_positions for value in sample]
+        self._pending_positions.clear()
+        
+        if self.map_loaded:
+            self.bridge.positionsChanged.emit(batch)
+    
     def add_waypoint(self, lat: float, lon: float, name: str = None, waypoint_id: str = None):
         """Add a waypoint to the map."""
+        self.add_waypoints_bulk([{'lat': lat, 'lon': lon, 'name': name, 'id': waypoint_id}])
+    
+    def add_waypoints_bulk(self, waypoints: List[Dict[str, Any]]):
+        """Add several waypoints with a single map update.
+        
+        Each item needs 'lat' and 'lon'; 'name' and 'id' are optional.
+        """
         try:
-            if waypoint_id is None:
-                waypoint_id = f"wp_{len(self.waypoints)}"
-            
-            if name is None:
-                name = f"Waypoint {len(self.waypoints) + 1}"
-            
-            self.waypoints[waypoint_id] = {
-                'lat': lat,
-                'lon': lon,
-                'name': name
-            }
+            added = []
+            for wp in waypoints:
+                waypoint_id = wp.get('id')
+                if waypoint_id is None:
+                    waypoint_id = f"wp_{len(self.waypoints)}"
+                
+                name = wp.get('name')
+                if name is None:
+                    name = f"Waypoint {len(self.waypoints) + 1}"
+                
+                lat, lon = wp['lat'], wp['lon']
+                self.waypoints[waypoint_id] = {
+                    'lat': lat,
+                    'lon': lon,
+                    'name': name
+                }
+                added.append({'id': waypoint_id, 'lat': lat, 'lon': lon, 'name': name})
             
-            if self.map_loaded:
-                self.web_view.page().runJavaScript(
-                    f"addWaypoint({lat}, {lon}, '{name}', '{waypoint_id}')"
-                )
+            if self.map_loaded and added:
+                self.bridge.waypointsAdded.emit(added)
             
-            self.waypoint_added.emit(lat, lon, name)
-            logger.info(f"Waypoint added: {name} at {lat:.6f}, {lon:.6f}")
+            for wp in added:
+                self.waypoint_added.emit(wp['lat'], wp['lon'], wp['name'])
+                logger.info(f"Waypoint added: {wp['name']} at {wp['lat']:.6f}, {wp['lon']:.6f}")
             
         except Exception as e:
-            logger.error(f"Error adding waypoint: {e}")
+            logger.error(f"Error adding waypoints: {e}")
     
     def remove_waypoint(self, waypoint_id: str):
         """Remove a waypoint from the map."""
@@ -893,7 +572,7 @@ class LeafletOnlineMap(QWidget):
                 del self.waypoints[waypoint_id]
                 
                 if self.map_loaded:
-                    self.web_view.page().runJavaScript(f"removeWaypoint('{waypoint_id}')")
+                    self.bridge.waypointRemoved.emit(waypoint_id)
                 
                 self.waypoint_removed.emit(waypoint_id)
                 logger.info(f"Waypoint removed: {waypoint_id}")
@@ -910,10 +589,7 @@ class LeafletOnlineMap(QWidget):
                 self.zoom_level = zoom
             
             if self.map_loaded:
-                zoom_param = zoom if zoom is not None else "null"
-                self.web_view.page().runJavaScript(
-                    f"setMapCenter({lat}, {lon}, {zoom_param})"
-                )
+                self.bridge.mapCenterChanged.emit(lat, lon, zoom or 0)
             
             logger.info(f"Map center set to: {lat:.6f}, {lon:.6f}")
             
@@ -928,8 +604,9 @@ class LeafletOnlineMap(QWidget):
             self.map_loaded = False
             self.map_stack.setCurrentWidget(self.loading_label)
             self.loading_label.setText("🔄 Harita yenileniyor...")
-            # Reload the page
+            # Reload the page; the load timeout covers the new load
             QTimer.singleShot(500, lambda: self.web_view.reload())
+            self.load_timeout.start()
             logger.info("Map refresh initiated")
         else:
             logger.warning("Cannot refresh map - not loaded yet")
@@ -937,16 +614,20 @@ class LeafletOnlineMap(QWidget):
     def resizeEvent(self, event):
         """Handle widget resize events."""
         super().resizeEvent(event)
-        # Force map resize when widget is resized
-        if self.map_loaded:
-            QTimer.singleShot(100, self.force_map_resize)
+        # Force map resize when widget is resized (at most one pending)
+        if self.map_loaded and not self._resize_timer.isActive():
+            self._resize_timer.start()
     
     def showEvent(self, event):
         """Handle widget show events."""
         super().showEvent(event)
+        # Generate and load the map only once the widget is actually shown
+        if not self._map_setup_done:
+            self._map_setup_done = True
+            self.setup_map()
         # Force map resize when widget becomes visible
-        if self.map_loaded:
-            QTimer.singleShot(500, self.force_map_resize)
+        elif self.map_loaded and not self._resize_timer.isActive():
+            self._resize_timer.start()
     
     def set_webengine_status(self, available: bool):
         """Set WebEngine availability status."""
@@ -7,11 +7,12 @@ import sys
 import os
 import time
 import math
-import serial.tools.list_ports
-import subprocess
-import psutil
+import json
+import logging
+import re
 import collections
 import collections.abc
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -19,16 +20,17 @@ from typing import Dict, Any, Optional
 if not hasattr(collections, 'MutableMapping'):
     collections.MutableMapping = collections.abc.MutableMapping
 
-# Third-party imports
-import dronekit
+# Third-party imports (dronekit is imported on first connect)
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton, 
     QMessageBox, QInputDialog
 )
-from PyQt5.QtCore import QTimer, QDateTime, QUrl, Qt, pyqtSlot
+from PyQt5.QtCore import (QTimer, QDateTime, QUrl, Qt, QEvent, QThread, QThreadPool, QSignalBlocker,
+                          QProcess, pyqtSignal, pyqtSlot)
 from PyQt5 import QtCore, uic
 from PyQt5.QtGui import QDesktopServices
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEngineProfile
+from PyQt5.QtWebEngineWidgets import QWebEngineSettings
+from PyQt5.QtWebChannel import QWebChannel
 
 
 from uav_system.ui.desktop.hud_widget import HUDWidget
@@ -39,33 +41,94 @@ from uav_system.ui.desktop.hud_widget import HUDWidget
 from uav_system.core.logging_config import get_logger
 from uav_system.core.exceptions import ConnectionError, UAVException
 from uav_system.communication.mavlink.mavlink_client import MAVLinkClient
+from uav_system.ui.desktop.mavlink_worker import MAVLinkWorker
+from uav_system.ui.desktop.dronekit_worker import DroneKitWorker
+from uav_system.ui.desktop.port_scanner import PortScanTask
+from uav_system.ui.desktop.shutdown_task import ShutdownTask
 # Import settings from config module at the project root
 
-from src.uav_system.flight_control.plane_controller import UAVPlane
-import sys
-from pathlib import Path
-project_root = Path(__file__).parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Module paths, computed once (desktop -> ui -> uav_system -> src -> project root)
+_MODULE_DIR = Path(__file__).resolve().parent
+_RESOURCES_DIR = _MODULE_DIR / "resources"
+_PROJECT_ROOT = _MODULE_DIR.parents[3]
+sys.path.insert(0, str(_PROJECT_ROOT))
 try:
     from config.settings import settings
 except ImportError:
     # Fallback settings
     class Settings:
-        PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+        PROJECT_ROOT = _PROJECT_ROOT
         TELEMETRY_UPDATE_RATE = 100
+        MAX_REDRAW_RATE = 10
         MAP_SERVER_PORT = 8080
         DEFAULT_BAUD_RATE = 57600
     settings = Settings()
 
 logger = get_logger(__name__)
 
+# Minimum change before a UAV position is pushed to the map again
+MAP_UPDATE_MIN_DEG = 1e-6      # ~0.1 m of latitude
+MAP_UPDATE_MIN_ALT = 0.5       # m
+MAP_UPDATE_MIN_HEADING = 1.0   # deg
+
+# Serial device at the start of a port entry / connection string ("COM8 (...)", "/dev/ttyUSB0,57600")
+_SERIAL_PORT_RE = re.compile(r'^(?:COM\d+|/dev/tty\w+)', re.IGNORECASE)
+
+# Radian -> derece (DroneKit/MAVLink attitude radyan gelir)
+_RAD2DEG = 180.0 / math.pi
+
+# MAVLink values used by the DroneKit message listeners
+_MAV_MODE_FLAG_SAFETY_ARMED = 128
+_MAV_TYPE_GCS = 6
+_MAV_AUTOPILOT_INVALID = 8
+_UINT16_MAX = 65535
+
+
+@dataclass(slots=True)
+class TelemetryState:
+    """Last known UAV state shown by the GCS (slot access instead of dict lookups)."""
+    lat: float = 39.9334
+    lon: float = 32.8597
+    alt: float = 0
+    heading: float = 0
+    ground_speed: float = 0
+    air_speed: float = 0
+    battery_voltage: float = 0
+    battery_current: float = 0
+    flight_mode: str = 'UNKNOWN'
+    armed: bool = False
+    gps_fix: int = 0
+    satellites: int = 0
+
+    def update(self, values: Dict[str, Any]):
+        """Copy the entries of values that map to a field; other keys are ignored."""
+        for key, value in values.items():
+            field_name = _TELEMETRY_STATE_KEYS.get(key)
+            if field_name is not None:
+                setattr(self, field_name, value)
+
+
+# Telemetry dict key -> TelemetryState field (field names plus the MAVLink/DroneKit spellings)
+_TELEMETRY_STATE_KEYS = {f.name: f.name for f in fields(TelemetryState)}
+_TELEMETRY_STATE_KEYS.update({
+    'altitude': 'alt',
+    'groundspeed': 'ground_speed',
+    'airspeed': 'air_speed',
+    'batteryVoltage': 'battery_voltage',
+    'flightMode': 'flight_mode',
+})
+
 # Try to import optional components
 try:
-    from .leaflet_map_widget import LeafletOnlineMap
+    from .leaflet_map_widget import (LeafletOnlineMap, OfflineMapBridge, create_webchannel_script,
+                                     get_leaflet_profile)
     LEAFLET_MAP_AVAILABLE = True
 except ImportError:
     logger.warning("LeafletOnlineMap not available")
     LeafletOnlineMap = None
+    OfflineMapBridge = None
+    create_webchannel_script = None
+    get_leaflet_profile = None
     LEAFLET_MAP_AVAILABLE = False
 
 try:
@@ -80,10 +143,50 @@ except ImportError:
     logger.warning("HUDWidget not available")
     HUDWidget = None
 
+try:
+    from ...communication.antenna_controller import AntennaController
+    from .video_receiver_widget import VideoDisplayWidget
+    _ANTENNA_IMPORT_ERROR = None
+except ImportError as e:
+    logger.warning(f"Antenna/video modules not available: {e}")
+    AntennaController = None
+    VideoDisplayWidget = None
+    _ANTENNA_IMPORT_ERROR = str(e)
+
 
 class HumaGCS(QMainWindow):
     """Modern Ground Control Station with improved architecture."""
     
+    # Asks the MAVLink worker (in its own thread) to connect to the given link
+    mavlinkConnectRequested = pyqtSignal(str)
+    dronekitConnectRequested = pyqtSignal(str)
+    dronekitCloseRequested = pyqtSignal(object)
+    
+    # Container QSS (sabit; _apply_style aynı stili tekrar uygulamaz)
+    _MAP_CONTAINER_QSS = "QLabel { margin: 0px; padding: 0px; border: none; background: #2c3e50; }"
+    _LABEL_TRANSPARENT_QSS = "QLabel { margin: 0px; padding: 0px; border: none; background: transparent; }"
+    _HUD_CONTAINER_QSS = "background-color: rgba(0, 50, 100, 180); border: 2px solid lime;"
+    _MAP_FALLBACK_QSS = ("color: #00ff00; font-size: 11pt; font-family: 'Courier New', monospace; "
+                         "background-color: #1e1e1e; padding: 20px; border: 1px solid #444;")
+    _MAP_ERROR_QSS = "color: red; font-size: 12pt; padding: 20px;"
+    
+    # Telemetry labels from huma_gcs.ui (any of them may be missing in a custom UI)
+    _TELEMETRY_LABELS = ('enlem', 'boylam', 'irtifa', 'roll', 'pitch', 'yaw',
+                         'havaHizi', 'yerHizi', 'mevcutUcusModu', 'armDurum')
+    # Buttons enabled only while a link is up
+    _FLIGHT_CONTROLS = ('AUTO', 'GUIDED', 'RTL', 'TAKEOFF', 'armDisarm')
+    # (label, %-format, telemetry key, display digits) for the numeric labels
+    _NUMERIC_LABEL_FMTS = (
+        ('enlem', "Lat: %.6f°", 'lat', 6),
+        ('boylam', "Lon: %.6f°", 'lon', 6),
+        ('irtifa', "Alt: %.1fm", 'altitude', 1),
+        ('roll', "Roll: %+.1f°", 'roll', 1),
+        ('pitch', "Pitch: %+.1f°", 'pitch', 1),
+        ('yaw', "Yaw: %.1f°", 'yaw', 1),
+        ('havaHizi', "AS: %.1fm/s", 'airspeed', 1),
+        ('yerHizi', "GS: %.1fm/s", 'groundspeed', 1),
+    )
+    
     def __init__(self):
         super().__init__()
         # Initialize core attributes
@@ -93,20 +196,58 @@ class HumaGCS(QMainWindow):
         self.webengine_available = True
         
         # UAV telemetry data
-        self.current_telemetry = {
-            'lat': 39.9334,
-            'lon': 32.8597,
-            'alt': 0,
-            'heading': 0,
-            'ground_speed': 0,
-            'air_speed': 0,
-            'battery_voltage': 0,
-            'battery_current': 0,
-            'flight_mode': 'UNKNOWN',
-            'armed': False,
-            'gps_fix': 0,
-            'satellites': 0
-        }
+        self.current_telemetry = TelemetryState()
+        
+        # Latest telemetry sample; the redraw timer only repaints when it changed
+        self._latest_telemetry = {}
+        # Filled by DroneKit message listeners (see _register_dronekit_listeners)
+        self._dronekit_telemetry = {}
+        self._dronekit_target = (0, 0)
+        self._telemetry_dirty = False
+        self._last_clock_sec = -1
+        
+        # Optional widgets resolved once after the UI is loaded (see _resolve_optional_widgets)
+        self._label_widgets = {}
+        self._numeric_labels = []
+        self._mode_label = None
+        self._arm_label = None
+        self._flight_controls = []
+        self._last_displayed = {}
+        self._clock_label = None
+        self._informer = None
+        self._status_label = None
+        self._map_centered_on_uav = False
+        
+        # Map updates are coalesced: only the newest position is sent per interval
+        self._pending_map_pos = None
+        self._last_map_pos = None
+        self._map_payload = {}
+        # Offline map page: typed QWebChannel pushes once the page has connected
+        self._offline_map_bridge = None
+        self._offline_map_ready = False
+        self._map_flush_timer = QTimer(self)
+        self._map_flush_timer.setSingleShot(True)
+        self._map_flush_timer.setInterval(100)
+        self._map_flush_timer.timeout.connect(self._flush_map_update)
+        
+        # Map clicks: handle at most one per 50 ms
+        self._pending_map_click = None
+        self._map_click_timer = QTimer(self)
+        self._map_click_timer.setSingleShot(True)
+        self._map_click_timer.setInterval(50)
+        self._map_click_timer.timeout.connect(self._handle_map_click)
+        
+        # Window resize: one map refresh 120 ms after the last resize event (restarted while dragging)
+        self._resize_debounce = QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(120)
+        self._resize_debounce.timeout.connect(self._refresh_map_after_resize)
+        
+        # Last serial port scan result [(device, description)]; None until the first scan
+        self._port_cache = None
+        self._port_scan_pending = False
+        # Connection string for the selected port; recomputed when the selection changes
+        self._connection_string = "udp:127.0.0.1:14550"
         
         # UI components
         self.canvas_map = None
@@ -117,18 +258,24 @@ class HumaGCS(QMainWindow):
         # Processes and threads
         self.camera_process = None
         self.camera_window_process = None
-        self.server_thread = None
-        self.check_server_thread = None
         
         # Communication
         self.mavlink_client = None
         
         # Communication
         self.mavlink_client = None
+        self.mavlink_worker = None
+        self.mav_thread = None
+        self._mavlink_connecting = False
+        self._mavlink_connection_string = ""
+        self.dronekit_worker = None
+        self._dronekit_connecting = False
+        # Set by disconnect/close while a connect is pending; its late result is dropped
+        self._connect_cancelled = False
+        self._connect_button = None
 
         # ─── PlaneController örneğini oluştur ve sakla ───
         # PlaneController will be initialized after connection is established
-        from src.uav_system.flight_control.plane_controller import UAVPlane
         self.plane_controller = None
 
         # Initialize UI and systems
@@ -142,7 +289,7 @@ class HumaGCS(QMainWindow):
         """Initialize the user interface."""
         try:
             # Load UI from file
-            ui_file_path = Path(__file__).parent / "resources" / "huma_gcs.ui"
+            ui_file_path = _RESOURCES_DIR / "huma_gcs.ui"
             if ui_file_path.exists():
                 uic.loadUi(str(ui_file_path), self)
                 logger.info(f"UI loaded from: {ui_file_path}")
@@ -153,6 +300,9 @@ class HumaGCS(QMainWindow):
             # Set window properties
             self.setWindowTitle("Hüma GCS - İnsansız Hava Aracı Kontrol İstasyonu v2.0")
             
+            # Resolve optional widgets once instead of hasattr() on every tick
+            self._resolve_optional_widgets()
+            
             # Setup port list
             self.setup_port_list()
             
@@ -166,6 +316,23 @@ class HumaGCS(QMainWindow):
             logger.error(f"Failed to setup UI: {e}")
             self.setup_fallback_ui()
     
+    def _resolve_optional_widgets(self):
+        """Look up the optional .ui widgets once (telemetry labels, flight controls, clock, informer, status)."""
+        self._label_widgets = {name: getattr(self, name) for name in self._TELEMETRY_LABELS
+                               if hasattr(self, name)}
+        # (label, widget, fmt, key, digits) for the numeric labels present in this UI
+        self._numeric_labels = [(name, self._label_widgets[name], fmt, key, digits)
+                                for name, fmt, key, digits in self._NUMERIC_LABEL_FMTS
+                                if name in self._label_widgets]
+        self._mode_label = self._label_widgets.get('mevcutUcusModu')
+        self._arm_label = self._label_widgets.get('armDurum')
+        self._flight_controls = [getattr(self, name) for name in self._FLIGHT_CONTROLS
+                                 if hasattr(self, name)]
+        self._clock_label = getattr(self, 'sunucuSaati', None)
+        self._informer = getattr(self, 'ihaInformer', None)
+        self._status_label = getattr(self, 'baglanti', None)
+        self._connect_button = getattr(self, 'baglan', None)
+    
     def setup_fallback_ui(self):
         """Setup a minimal fallback UI if main UI file is not available."""
         self.setWindowTitle("Hüma GCS - Fallback Mode")
@@ -177,35 +344,77 @@ class HumaGCS(QMainWindow):
         self.setCentralWidget(central_widget)
     
     def setup_port_list(self):
-        """Setup the COM port list."""
+        """Setup the COM port list (serial ports are filled in asynchronously)."""
         if not hasattr(self, 'portList'):
             logger.warning("portList widget not found in UI")
             return
         
+        # Add default UDP option
+        self.portList.addItem("UDP (127.0.0.1:14550)")
+        
+        self.portList.currentIndexChanged.connect(self._update_connection_string)
+        
+        # Rescan when the user opens the list; first scan after the window paints
+        self.portList.installEventFilter(self)
+        QTimer.singleShot(0, self.refresh_port_list)
+    
+    def refresh_port_list(self):
+        """Enumerate serial ports in the thread pool unless a scan is already running."""
+        if self._port_scan_pending:
+            return
+        self._port_scan_pending = True
+        task = PortScanTask()
+        task.signals.finished.connect(self.on_ports_scanned)
+        QThreadPool.globalInstance().start(task)
+    
+    @pyqtSlot(list)
+    def on_ports_scanned(self, ports: list):
+        """Populate portList from a finished background scan."""
+        self._port_scan_pending = False
+        if ports == self._port_cache:
+            return
+        first_scan = self._port_cache is None
+        self._port_cache = ports
+        
+        # Default UDP option first, then COM ports with detailed information
+        items = ["UDP (127.0.0.1:14550)"]
+        for device, description in ports:
+            port_info = f"{device}"
+            if description and description != "n/a":
+                port_info += f" ({description})"
+            items.append(port_info)
+        logger.info(f"Available COM ports: {[device for device, _ in ports]}")
+        
+        port_list = self.portList
+        blocker = QSignalBlocker(port_list)
+        port_list.setUpdatesEnabled(False)
         try:
-            ports = serial.tools.list_ports.comports()
-            
-            # Add default UDP option
-            self.portList.addItem("UDP (127.0.0.1:14550)")
-            
-            # Add COM ports with detailed information
-            for port in ports:
-                port_info = f"{port.device}"
-                if port.description and port.description != "n/a":
-                    port_info += f" ({port.description})"
-                self.portList.addItem(port_info)
-            
-            logger.info(f"Available COM ports: {[p.device for p in ports]}")
-            
-            # Select COM8 by default if available (for Pixhawk)
-            for i in range(self.portList.count()):
-                if "COM8" in self.portList.itemText(i):
-                    self.portList.setCurrentIndex(i)
+            previous = port_list.currentText()
+            port_list.clear()
+            port_list.addItems(items)
+            
+            # Keep the user's selection across rescans
+            index = port_list.findText(previous)
+            if first_scan or index < 0:
+                # Select COM8 by default if available (for Pixhawk)
+                index = next((i for i, text in enumerate(items) if "COM8" in text), 0)
+                if index:
                     logger.info("COM8 selected by default")
-                    break
+            port_list.setCurrentIndex(index)
                     
         except Exception as e:
             logger.error(f"Failed to setup port list: {e}")
+        finally:
+            port_list.setUpdatesEnabled(True)
+            blocker.unblock()
+        # Selection changed while signals were blocked
+        self._update_connection_string()
+    
+    def eventFilter(self, obj, event):
+        """Refresh the serial port list when its popup is opened."""
+        if event.type() == QEvent.MouseButtonPress and obj is self.portList:
+            self.refresh_port_list()
+        return super().eventFilter(obj, event)
     
     def setup_communication(self):
         """Initialize communication systems."""
@@ -216,6 +425,22 @@ class HumaGCS(QMainWindow):
                 logger.info("MAVLink client initialized successfully")
             else:
                 logger.error("Failed to initialize MAVLink client")
+            
+            # Connect (heartbeat bekleme) ve telemetri GUI thread dışında
+            self.mav_thread = QThread(self)
+            self.mavlink_worker = MAVLinkWorker(self.mavlink_client, getattr(settings, 'MAX_REDRAW_RATE', 10))
+            self.mavlink_worker.moveToThread(self.mav_thread)
+            self.mavlinkConnectRequested.connect(self.mavlink_worker.run)
+            self.mavlink_worker.connectFinished.connect(self.on_mavlink_connect_finished, Qt.QueuedConnection)
+            self.mavlink_worker.telemetryUpdated.connect(self.on_telemetry_received, Qt.QueuedConnection)
+            
+            # DroneKit connect/close de aynı thread'de (ikisi asla aynı anda beklemez)
+            self.dronekit_worker = DroneKitWorker()
+            self.dronekit_worker.moveToThread(self.mav_thread)
+            self.dronekitConnectRequested.connect(self.dronekit_worker.run)
+            self.dronekitCloseRequested.connect(self.dronekit_worker.close)
+            self.dronekit_worker.connectFinished.connect(self.on_dronekit_connect_finished, Qt.QueuedConnection)
+            self.mav_thread.start()
                 
         except Exception as e:
             logger.error(f"Failed to setup communication: {e}")
@@ -243,21 +468,6 @@ class HumaGCS(QMainWindow):
             return
         
         try:
-            # Show loading message
-            self.label.setText("🗺️ Leaflet haritası yükleniyor...\nLütfen bekleyin.")
-            self.label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 16pt;
-                    font-weight: bold;
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #3498db, stop:1 #2980b9);
-                    padding: 20px;
-                    border-radius: 10px;
-                    border: 2px solid #2c3e50;
-                }
-            """)
-            
             # Try to create Leaflet online map first
             if LEAFLET_MAP_AVAILABLE and self.webengine_available:
                 self.create_leaflet_map()
@@ -271,46 +481,50 @@ class HumaGCS(QMainWindow):
             logger.error(f"Map view setup failed: {e}")
             self.show_map_error(f"Harita kurulumu hatası: {str(e)}")
     
+    @staticmethod
+    def _apply_style(widget, qss: str):
+        """Set a stylesheet only if it differs (every setStyleSheet re-polishes the subtree)."""
+        if widget.styleSheet() != qss:
+            widget.setStyleSheet(qss)
+    
+    @staticmethod
+    def _place_in_container(container, widget):
+        """Make widget the only child in container's layout, rebuilding only when it differs."""
+        from PyQt5.QtWidgets import QVBoxLayout
+        layout = container.layout()
+        if layout is None:
+            layout = QVBoxLayout(container)
+            layout.setContentsMargins(0, 0, 0, 0)  # Remove all margins
+            layout.setSpacing(0)  # Remove spacing between widgets
+        elif layout.count() == 1 and layout.itemAt(0).widget() is widget:
+            return
+        
+        # Clear existing layout contents
+        while layout.count():
+            child = layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+        layout.addWidget(widget)
+    
     def create_leaflet_map(self):
         """Create Leaflet online map."""
         try:
             logger.info("Creating Leaflet online map...")
             
             # Fix label size policy for proper expansion
-            from PyQt5.QtWidgets import QSizePolicy, QVBoxLayout
+            from PyQt5.QtWidgets import QSizePolicy
             self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             self.label.setMinimumSize(600, 400)
             self.label.setMaximumSize(16777215, 16777215)  # Remove maximum size constraints
             
             # Remove border and add proper styling for map container
-            self.label.setStyleSheet("""
-                QLabel {
-                    margin: 0px;
-                    padding: 0px;
-                    border: none;
-                    background: #2c3e50;
-                }
-            """)
+            self._apply_style(self.label, self._MAP_CONTAINER_QSS)
             
             # Create Leaflet map widget as a child of the label
             self.leaflet_map = LeafletOnlineMap(self.label)
             
-            # Create a layout for the label if it doesn't have one
-            if self.label.layout() is None:
-                layout = QVBoxLayout(self.label)
-                layout.setContentsMargins(0, 0, 0, 0)  # Remove all margins
-                layout.setSpacing(0)  # Remove spacing between widgets
-                self.label.setLayout(layout)
-            
-            # Clear existing layout contents
-            layout = self.label.layout()
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
             # Add the map widget to the label's layout with proper expansion
-            layout.addWidget(self.leaflet_map)
+            self._place_in_container(self.label, self.leaflet_map)
             
             # Ensure map widget expands properly
             self.leaflet_map.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -318,9 +532,10 @@ class HumaGCS(QMainWindow):
             
             # Connect signals
             self.leaflet_map.map_ready.connect(self.on_leaflet_map_ready)
-            self.leaflet_map.map_clicked.connect(self.on_map_clicked)
-            self.leaflet_map.waypoint_added.connect(self.on_waypoint_added)
-            self.leaflet_map.waypoint_removed.connect(self.on_waypoint_removed)
+            # Queued: the map's (bridge) call returns immediately, handlers run from the event loop
+            self.leaflet_map.map_clicked.connect(self.on_map_clicked, Qt.QueuedConnection)
+            self.leaflet_map.waypoint_added.connect(self.on_waypoint_added, Qt.QueuedConnection)
+            self.leaflet_map.waypoint_removed.connect(self.on_waypoint_removed, Qt.QueuedConnection)
             
             # Set WebEngine status
             self.leaflet_map.set_webengine_status(self.webengine_available)
@@ -343,74 +558,78 @@ class HumaGCS(QMainWindow):
             logger.info("Leaflet map is ready and functional")
             self.map_loaded = True
             self.map_widget = self.leaflet_map
+            self._last_map_pos = None  # new page: next position always goes through
             
             # Start telemetry updates if drone is connected
-            if self.connection_active and self.current_telemetry:
-                self.update_map_with_uav_data(self.current_telemetry)
+            if self.connection_active:
+                state = self.current_telemetry
+                self.update_map_with_uav_data({'lat': state.lat, 'lon': state.lon,
+                                               'altitude': state.alt, 'yaw': state.heading})
         else:
             logger.error("Leaflet map failed to initialize")
             self.create_offline_map()
     
     def on_map_clicked(self, lat: float, lon: float):
-        """Handle map click events."""
-        logger.info(f"Map clicked at: {lat:.6f}, {lon:.6f}")
+        """Handle map click events (bursts are coalesced; the latest click wins)."""
+        self._pending_map_click = (lat, lon)
+        if not self._map_click_timer.isActive():
+            self._map_click_timer.start()
+    
+    def _handle_map_click(self):
+        """Process the most recent map click."""
+        lat, lon = self._pending_map_click
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Map clicked at: %.6f, %.6f", lat, lon)
         # You can add waypoint creation logic here if needed
     
     def on_waypoint_added(self, lat: float, lon: float, name: str):
         """Handle waypoint added events."""
-        logger.info(f"Waypoint added: {name} at {lat:.6f}, {lon:.6f}")
+        logger.info("Waypoint added: %s at %.6f, %.6f", name, lat, lon)
     
     def on_waypoint_removed(self, waypoint_id: str):
         """Handle waypoint removed events."""
-        logger.info(f"Waypoint removed: {waypoint_id}")
+        logger.info("Waypoint removed: %s", waypoint_id)
     
     def create_offline_map(self):
         """Create a simple offline map using static HTML and basic drawing."""
         try:
-            # Create a simple map HTML without external dependencies
-            offline_map_html = self.generate_offline_map_html()
-            
-            # Save to temp file
-            map_file_path = Path(__file__).parent / "resources" / "offline_map.html"
-            map_file_path.parent.mkdir(exist_ok=True)
-            
-            with open(map_file_path, 'w', encoding='utf-8') as f:
-                f.write(offline_map_html)
+            # The page is static and shipped in resources/; only rebuild it if it is missing
+            map_file_path = _RESOURCES_DIR / "offline_map.html"
+            if not map_file_path.exists():
+                map_file_path.parent.mkdir(exist_ok=True)
+                with open(map_file_path, 'w', encoding='utf-8') as f:
+                    f.write(self.generate_offline_map_html())
             
             # Create web view if label exists
             if hasattr(self, 'label') and self.label:
-                from PyQt5.QtWebEngineWidgets import QWebEngineView
-                from PyQt5.QtWidgets import QVBoxLayout
+                from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
                 
                 self.map_widget = QWebEngineView(self.label)
+                if get_leaflet_profile is not None:
+                    # Same profile as the Leaflet map: one browser context instead of two
+                    self.map_widget.setPage(QWebEnginePage(get_leaflet_profile(), self.map_widget))
                 
-                # Create layout for the label if it doesn't exist
-                if self.label.layout() is None:
-                    layout = QVBoxLayout(self.label)
-                    layout.setContentsMargins(0, 0, 0, 0)  # Remove all margins
-                    layout.setSpacing(0)  # Remove spacing
-                    self.label.setLayout(layout)
-                
-                # Clear existing layout contents
-                layout = self.label.layout()
-                while layout.count():
-                    child = layout.takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
+                # Persistent telemetry channel (the page connects once; no script per update)
+                self._offline_map_ready = False
+                if OfflineMapBridge is not None:
+                    if self._offline_map_bridge is None:
+                        self._offline_map_bridge = OfflineMapBridge(self)
+                        self._offline_map_bridge.ready.connect(self.on_offline_map_ready)
+                    page = self.map_widget.page()
+                    channel = QWebChannel(page)
+                    channel.registerObject("gcs", self._offline_map_bridge)
+                    page.setWebChannel(channel)
+                    webchannel_script = create_webchannel_script()
+                    if webchannel_script is not None:
+                        page.scripts().insert(webchannel_script)
                 
-                # Add map widget to layout
-                layout.addWidget(self.map_widget)
+                # Add map widget to layout (the replaced Leaflet view is deleted here)
+                self._place_in_container(self.label, self.map_widget)
+                self.leaflet_map = None
                 
                 # Remove label margins and styling
                 self.label.setContentsMargins(0, 0, 0, 0)
-                self.label.setStyleSheet("""
-                    QLabel {
-                        margin: 0px;
-                        padding: 0px;
-                        border: none;
-                        background: transparent;
-                    }
-                """)
+                self._apply_style(self.label, self._LABEL_TRANSPARENT_QSS)
                 
                 # Configure web settings for offline use
                 settings_web = self.map_widget.settings()
@@ -435,7 +654,7 @@ class HumaGCS(QMainWindow):
             self.show_simple_map_fallback()
     
     def generate_offline_map_html(self) -> str:
-        """Generate simple offline map HTML."""
+        """Generate simple offline map HTML (same content as resources/offline_map.html)."""
         return '''
         <!DOCTYPE html>
         <html>
@@ -543,9 +762,9 @@ class HumaGCS(QMainWindow):
                 </div>
                 
                 <div class="coordinates">
-                    <div>Lat: 39.9334°</div>
-                    <div>Lon: 32.8597°</div>
-                    <div>Alt: 0 m</div>
+                    <div>Lat: <span id="coord-lat">39.9334</span>°</div>
+                    <div>Lon: <span id="coord-lon">32.8597</span>°</div>
+                    <div>Alt: <span id="coord-alt">0</span> m</div>
                 </div>
                 
                 <div class="offline-notice">
@@ -560,22 +779,27 @@ class HumaGCS(QMainWindow):
                 // Simple JavaScript for offline map functionality
                 console.log("Offline map loaded successfully");
                 
-                // Update coordinates periodically (simulation)
-                function updateCoordinates() {
-                    const coordDiv = document.querySelector('.coordinates');
-                    const lat = (39.9334 + (Math.random() - 0.5) * 0.001).toFixed(6);
-                    const lon = (32.8597 + (Math.random() - 0.5) * 0.001).toFixed(6);
-                    const alt = Math.floor(Math.random() * 100);
-                    
-                    coordDiv.innerHTML = `
-                        <div>Lat: ${lat}°</div>
-                        <div>Lon: ${lon}°</div>
-                        <div>Alt: ${alt} m</div>
-                    `;
+                // Telemetry from the GCS: one JSON object per update
+                const coordLat = document.getElementById('coord-lat');
+                const coordLon = document.getElementById('coord-lon');
+                const coordAlt = document.getElementById('coord-alt');
+                
+                function applyTelemetry(t) {
+                    coordLat.textContent = t.lat.toFixed(6);
+                    coordLon.textContent = t.lon.toFixed(6);
+                    coordAlt.textContent = Math.round(t.alt);
                 }
                 
-                // Update every 5 seconds
-                setInterval(updateCoordinates, 5000);
+                // Persistent channel: Python emits typed values, no script per update
+                if (typeof QWebChannel !== 'undefined' && typeof qt !== 'undefined') {
+                    new QWebChannel(qt.webChannelTransport, function(channel) {
+                        var gcs = channel.objects.gcs;
+                        gcs.telemetryChanged.connect(function(lat, lon, alt, heading, battery) {
+                            applyTelemetry({lat: lat, lon: lon, alt: alt, heading: heading, battery: battery});
+                        });
+                        gcs.pageReady();
+                    });
+                }
                 
                 // Hide offline notice after 5 seconds
                 setTimeout(() => {
@@ -614,24 +838,27 @@ UAV kontrolleri normal çalışmaya devam edecek.
         
         if hasattr(self, 'label'):
             self.label.setText(fallback_text)
-            self.label.setStyleSheet("""
-                color: #00ff00; 
-                font-size: 11pt; 
-                font-family: 'Courier New', monospace;
-                background-color: #1e1e1e; 
-                padding: 20px;
-                border: 1px solid #444;
-            """)
+            self._apply_style(self.label, self._MAP_FALLBACK_QSS)
     
     def on_offline_map_loaded(self, success):
         """Handle offline map load completion."""
         if success:
             self.label.setText("")
-            self.label.setStyleSheet("background: transparent;")
+            self._apply_style(self.label, self._LABEL_TRANSPARENT_QSS)
+            # Show the last known position once; later updates come from applyTelemetry pushes
+            state = self.current_telemetry
+            self._pending_map_pos = (state.lat, state.lon, state.alt, state.heading)
+            self._flush_map_update()
             logger.info("Offline map loaded successfully")
         else:
             logger.warning("Offline map failed to load, showing fallback")
             self.show_simple_map_fallback()
+    
+    def on_offline_map_ready(self):
+        """The offline page listens on the channel; later updates use the bridge signal."""
+        self._offline_map_ready = True
+        logger.info("Offline map channel connected")
+    
     def setup_hud_view(self):
         """Setup the HUD (Heads-Up Display) component."""
         if not HUDWidget:
@@ -647,23 +874,8 @@ UAV kontrolleri normal çalışmaya devam edecek.
             # HUD widget'ını container içine yerleştir
             self.hud_widget = HUDWidget(self.label_2)
             
-            # Container'ın layout'unu ayarla
-            from PyQt5.QtWidgets import QVBoxLayout
-            if self.label_2.layout() is None:
-                layout = QVBoxLayout(self.label_2)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                self.label_2.setLayout(layout)
-                
-            # Mevcut layout'u temizle
-            layout = self.label_2.layout()
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-                    
-            # HUD widget'ını layout'a ekle
-            layout.addWidget(self.hud_widget)
+            # HUD widget'ını container layout'una ekle
+            self._place_in_container(self.label_2, self.hud_widget)
             
             # HUD widget boyutlandırma
             from PyQt5.QtWidgets import QSizePolicy
@@ -671,22 +883,14 @@ UAV kontrolleri normal çalışmaya devam edecek.
             
             # Container'ı temizle ve stil ayarla
             self.label_2.setText("")
-            self.label_2.setStyleSheet("""
-                background-color: rgba(0, 50, 100, 180);
-                border: 2px solid lime;
-            """)
+            self._apply_style(self.label_2, self._HUD_CONTAINER_QSS)
             
-            # HUD'u görünür yap
-            self.hud_widget.setVisible(True)
+            # HUD'u görünür yap; boyutunu layout verir, ilk çizim pencere gösterilince olur
             self.hud_widget.show()
             
             # İlk bağlantı durumunu ayarla
             self.hud_widget.setConnectionState(False)
             
-            # İlk güncellemeyi zorla
-            self.hud_widget.update()
-            self.hud_widget.repaint()
-            
             logger.info(f"HUD widget created in label_2 container")
             logger.info("HUD view setup completed")
             
@@ -695,14 +899,6 @@ UAV kontrolleri normal çalışmaya devam edecek.
             import traceback
             traceback.print_exc()
     
-    def resizeEvent(self, event):
-        """Handle window resize."""
-        super().resizeEvent(event)
-        
-        # HUD artık container içinde olduğu için otomatik olarak boyutlanır
-        if hasattr(self, 'hud_widget') and self.hud_widget:
-            self.hud_widget.update()  # Yeniden çizim için güncelle
-    
     def setup_ui_connections(self):
         """Setup UI button connections and signals."""
         try:
@@ -783,14 +979,24 @@ UAV kontrolleri normal çalışmaya devam edecek.
         try:
             # Clock timer
             self.clock_timer = QTimer(self)
+            self.clock_timer.setTimerType(Qt.CoarseTimer)  # saniye altı doğruluk gereksiz
             self.clock_timer.timeout.connect(self.update_server_time)
             self.clock_timer.start(1000)  # Update every second
             
-            # Telemetry timer
+            # Telemetry timer (data rate) - only for polled sources (simulation/DroneKit);
+            # a MAVLink link pushes samples and stops it
             self.telemetry_timer = QTimer(self)
-            self.telemetry_timer.timeout.connect(self.update_telemetry_display)
+            self.telemetry_timer.timeout.connect(self.poll_telemetry)
             self.telemetry_timer.start(settings.TELEMETRY_UPDATE_RATE)
             
+            # Redraw timer: single-shot, armed by a new sample, so an idle link
+            # causes no wakeups and redraws stay capped at MAX_REDRAW_RATE
+            self.max_redraw_rate = getattr(settings, 'MAX_REDRAW_RATE', 10)
+            self.redraw_timer = QTimer(self)
+            self.redraw_timer.setSingleShot(True)
+            self.redraw_timer.setInterval(int(1000 / self.max_redraw_rate))
+            self.redraw_timer.timeout.connect(self.update_telemetry_display)
+            
             logger.info("Timers setup completed")
             
         except Exception as e:
@@ -801,23 +1007,38 @@ UAV kontrolleri normal çalışmaya devam edecek.
         # Skip complex map initialization, use simple offline map instead
         logger.info("Map initialization completed (offline mode)")
         
-        # Optional: Try to detect internet connectivity
-        try:
-            import urllib.request
-            urllib.request.urlopen('https://www.google.com', timeout=3)
+        # Optional: Try to detect internet connectivity (asynchronous, never blocks startup)
+        from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
+        self._net_probe = QNetworkAccessManager(self)
+        reply = self._net_probe.head(QNetworkRequest(QUrl('https://www.google.com')))
+        reply.finished.connect(lambda: self.on_internet_probe_finished(reply))
+        # Timeout timer is a child of the reply, so it goes away with it
+        timeout = QTimer(reply)
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(reply.abort)
+        timeout.start(3000)
+    
+    def on_internet_probe_finished(self, reply):
+        """Log the result of the connectivity probe started in initialize_map."""
+        from PyQt5.QtNetwork import QNetworkReply
+        if reply.error() == QNetworkReply.NoError:
             logger.info("Internet connection detected - online maps could be enabled")
-        except:
+        else:
             logger.info("No internet connection - using offline map mode")
+        reply.deleteLater()
     
     def start_map_server(self):
         """Disabled - using offline map instead."""
         logger.info("Map server not needed for offline mode")
     
     def connect_drone(self):
-        """Connect to the drone."""
-        if not hasattr(self, 'ihaInformer'):
+        """Connect to the drone (the blocking connect runs in the worker thread)."""
+        if self._informer is None:
             logger.error("UI informer widget not found")
             return
+        if self._dronekit_connecting or self._mavlink_connecting:
+            return
+        self._connect_cancelled = False
 
         try:
             self.ihaInformer.append("🔄 İHA'ya bağlanılıyor...")
@@ -825,149 +1046,283 @@ UAV kontrolleri normal çalışmaya devam edecek.
             # Get connection string from UI
             connection_string = self.get_connection_string()
 
-            # Try DroneKit first for COM ports
-            if "COM" in connection_string.upper():
-                success = self.connect_dronekit(connection_string)
+            # Try DroneKit first for serial ports
+            if _SERIAL_PORT_RE.match(connection_string):
+                self.connect_dronekit(connection_string)
             else:
-                success = False
+                self.request_mavlink_connect(connection_string)
 
-            # Fallback to MAVLink
-            if not success and self.mavlink_client:
-                success = self.mavlink_client.connect(connection_string)
-                if success:
-                    self.connection_active = True
-                    self.ihaInformer.append("✅ İHA bağlantısı başarılı! (MAVLink)")
-                    # ─── PlaneController’a gerçek bağlantıyı ver ───
-                    self.plane_controller = UAVPlane(vehicle=None, connection_string=connection_string)
-                    # Set the MAVLink connection directly in the plane controller
-                    self.plane_controller.connection = self.mavlink_client.connection
-                    self.plane_controller.connected = True
-                    self.plane_controller.mavlink_client = self.mavlink_client
-                    # Eğer DroneKit vehicle örneğiniz varsa onu da atayabilirsiniz:
-                    # self.plane_controller.vehicle = self.mavlink_client.vehicle
+        except Exception as e:
+            logger.error(f"Connection failed: {e}")
+            self.ihaInformer.append(f"🚫 Bağlantı hatası: {e}")
 
-            if success:
-                # Enable flight controls
-                self.enable_flight_controls()
+    def request_mavlink_connect(self, connection_string: str):
+        """Ask the worker thread for a MAVLink connect (fallback after DroneKit)."""
+        if not self.mavlink_worker:
+            self.ihaInformer.append("❌ Bağlantı başarısız! Ayarları kontrol edin.")
+            self._update_connect_button()
+            return
+        self._mavlink_connecting = True
+        self._mavlink_connection_string = connection_string
+        self._update_connect_button()
+        self.mavlinkConnectRequested.emit(connection_string)
+        self.ihaInformer.append("⏳ MAVLink heartbeat bekleniyor...")
 
-                # Update connection status
-                if hasattr(self, 'baglanti'):
-                    self.baglanti.setText("Bağlantı: 🟢 Aktif")
+    def _update_connect_button(self):
+        """Keep the connect button disabled while a connect attempt is pending."""
+        if self._connect_button is not None:
+            self._connect_button.setEnabled(not (self._dronekit_connecting or self._mavlink_connecting))
 
-                # Start telemetry updates
-                self.setup_telemetry_timer()
+    @pyqtSlot(bool)
+    def on_mavlink_connect_finished(self, success: bool):
+        """Handle the result of the worker's MAVLink connect attempt."""
+        self._mavlink_connecting = False
+        self._update_connect_button()
+        if self._connect_cancelled:
+            self._connect_cancelled = False
+            if success:
+                self.mavlink_client.disconnect()
+            logger.info("MAVLink connect finished after disconnect; result dropped")
+            return
+        if not success:
+            self.ihaInformer.append("❌ Bağlantı başarısız! Ayarları kontrol edin.")
+            return
+        
+        self.connection_active = True
+        self.ihaInformer.append("✅ İHA bağlantısı başarılı! (MAVLink)")
+        # ─── PlaneController’a gerçek bağlantıyı ver ───
+        # (queued slot: an uncaught exception here would abort the application)
+        try:
+            from src.uav_system.flight_control.plane_controller import UAVPlane
+            self.plane_controller = UAVPlane(vehicle=None, connection_string=self._mavlink_connection_string)
+            # Set the MAVLink connection directly in the plane controller
+            self.plane_controller.connection = self.mavlink_client.connection
+            self.plane_controller.connected = True
+            self.plane_controller.mavlink_client = self.mavlink_client
+            # Eğer DroneKit vehicle örneğiniz varsa onu da atayabilirsiniz:
+            # self.plane_controller.vehicle = self.mavlink_client.vehicle
+        except Exception as e:
+            logger.error(f"PlaneController setup failed: {e}")
+            self.plane_controller = None
+            self.ihaInformer.append(f"⚠️ Uçuş kontrolcüsü başlatılamadı: {e}")
+        
+        self.on_connection_established()
+
+    def on_connection_established(self):
+        """Common UI setup once a DroneKit or MAVLink link is up."""
+        try:
+            # Enable flight controls
+            self.enable_flight_controls()
 
-                # Get initial telemetry and update map
-                initial_telemetry = self.get_current_telemetry()
-                if initial_telemetry:
-                    self.update_map_with_uav_data(initial_telemetry)
+            # Update connection status
+            if self._status_label is not None:
+                self.baglanti.setText("Bağlantı: 🟢 Aktif")
 
-                self.ihaInformer.append("📡 Telemetri verisi alınıyor...")
-                logger.info("Drone connection successful, telemetry started")
+            # Start telemetry updates (MAVLink pushes samples, other sources are polled)
+            if self.mavlink_client and self.mavlink_client.is_connected:
+                self.telemetry_timer.stop()
             else:
-                self.ihaInformer.append("❌ Bağlantı başarısız! Ayarları kontrol edin.")
+                self.setup_telemetry_timer()
 
+            # Get initial telemetry and update map
+            initial_telemetry = self.get_current_telemetry()
+            if initial_telemetry:
+                self.update_map_with_uav_data(initial_telemetry)
+
+            self.ihaInformer.append("📡 Telemetri verisi alınıyor...")
+            logger.info("Drone connection successful, telemetry started")
+            
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
+            logger.error(f"Connection setup failed: {e}")
             self.ihaInformer.append(f"🚫 Bağlantı hatası: {e}")
 
     def setup_telemetry_timer(self):
         """Setup telemetry update timer."""
         if not hasattr(self, 'telemetry_timer'):
-            self.telemetry_timer = QTimer()
-            self.telemetry_timer.timeout.connect(self.update_telemetry_display)
+            self.telemetry_timer = QTimer(self)
+            self.telemetry_timer.timeout.connect(self.poll_telemetry)
         
         # Start telemetry updates at configured rate
         update_rate = getattr(settings, 'TELEMETRY_UPDATE_RATE', 100)  # Default 100ms
         self.telemetry_timer.start(update_rate)
         logger.info(f"Telemetry timer started with {update_rate}ms interval")
     
-    def connect_dronekit(self, connection_string: str) -> bool:
-        """Connect using DroneKit with improved error handling."""
+    def connect_dronekit(self, connection_string: str):
+        """Start a DroneKit connect in the worker thread; the result arrives in on_dronekit_connect_finished."""
+        if not self.dronekit_worker:
+            self.request_mavlink_connect(connection_string)
+            return
+        self._dronekit_connecting = True
+        self._mavlink_connection_string = connection_string
+        self._update_connect_button()
+        self.dronekitConnectRequested.emit(connection_string)
+        self.ihaInformer.append("⏳ DroneKit bağlantısı bekleniyor...")
+    
+    @pyqtSlot(object, str)
+    def on_dronekit_connect_finished(self, vehicle, error: str):
+        """Handle the result of the worker's DroneKit connect attempt."""
+        self._dronekit_connecting = False
+        if self._connect_cancelled:
+            self._connect_cancelled = False
+            self._update_connect_button()
+            if vehicle is not None:
+                self.dronekitCloseRequested.emit(vehicle)
+            logger.info("DroneKit connect finished after disconnect; result dropped")
+            return
+        if vehicle is None:
+            # Fallback to MAVLink
+            self.request_mavlink_connect(self._mavlink_connection_string)
+            return
+        
+        self._update_connect_button()
+        self.uav = vehicle
+        
+        # Override the problematic mode listener  
         try:
-            # Suppress DroneKit logging for mode compatibility issues
-            import logging
-            dronekit_logger = logging.getLogger('dronekit')
-            original_level = dronekit_logger.level
-            dronekit_logger.setLevel(logging.CRITICAL)
-            
-            try:
-                self.uav = dronekit.connect(
-                    connection_string, 
-                    wait_ready=['gps_0', 'armed', 'mode', 'attitude'], 
-                    timeout=15
-                )
-                
-                if self.uav:
-                    # Add custom message handler to suppress mode errors
-                    def suppress_mode_errors(vehicle, name, msg):
-                        # Silently ignore mode definition errors
-                        pass
-                    
-                    # Override the problematic mode listener  
-                    try:
-                        @self.uav.on_message('HEARTBEAT')
-                        def heartbeat_handler(vehicle, name, message):
-                            # Custom heartbeat handler that doesn't crash on unknown modes
-                            try:
-                                # Update basic connection status without mode parsing
-                                pass
-                            except Exception:
-                                # Silently ignore mode parsing errors
-                                pass
-                    except Exception:
-                        # If we can't set up the handler, continue anyway
-                        pass
-                    
-                    self.connection_active = True
-                    logger.info("DroneKit connection successful")
-                    return True
-                    
-            finally:
-                # Restore original logging level
-                dronekit_logger.setLevel(original_level)
-                
+            @self.uav.on_message('HEARTBEAT')
+            def heartbeat_handler(vehicle, name, message):
+                # Custom heartbeat handler that doesn't crash on unknown modes
+                pass
+        except Exception:
+            # If we can't set up the handler, continue anyway
+            pass
+        
+        try:
+            # Push model: DroneKit's reader thread fills a plain dict as messages arrive
+            self._register_dronekit_listeners(self.uav)
         except Exception as e:
-            logger.error(f"DroneKit connection failed: {e}")
-            
-        return False
+            logger.error(f"DroneKit listener setup failed: {e}")
+        
+        self.connection_active = True
+        logger.info("DroneKit connection successful")
+        self.ihaInformer.append("✅ İHA bağlantısı başarılı! (DroneKit)")
+        self.on_connection_established()
     
-    def get_connection_string(self) -> str:
-        """Get connection string from UI selection."""
-        if not hasattr(self, 'portList'):
-            return "udp:127.0.0.1:14550"
+    def _register_dronekit_listeners(self, vehicle):
+        """Seed the DroneKit telemetry dict once, then keep it current from raw messages."""
+        tele = self._dronekit_telemetry
+        frame = vehicle.location.global_relative_frame
+        attitude = vehicle.attitude
+        battery = vehicle.battery
+        gps = getattr(vehicle, 'gps_0', None)
+        roll, pitch, yaw = attitude.roll, attitude.pitch, attitude.yaw
+        tele.update({
+            "lat": float(frame.lat or 0),
+            "lon": float(frame.lon or 0),
+            "altitude": float(frame.alt or 0),
+            "roll": 0.0 if roll is None else roll * _RAD2DEG,
+            "pitch": 0.0 if pitch is None else pitch * _RAD2DEG,
+            "yaw": 0.0 if yaw is None else yaw * _RAD2DEG,
+            "airspeed": float(vehicle.airspeed or 0),
+            "groundspeed": float(vehicle.groundspeed or 0),
+            "armed": bool(vehicle.armed),
+            "flightMode": str(vehicle.mode.name),
+            "batteryLevel": float(battery.level or 0),
+            "batteryVoltage": float(battery.voltage or 0),
+            "gps_fix": int(gps.fix_type or 0) if gps else 0,
+            "satellites": int(gps.satellites_visible or 0) if gps else 0,
+        })
         
+        # Vehicle's own system/component ids (0 = not known, not filtered)
+        master = getattr(vehicle, '_master', None)
+        self._dronekit_target = (getattr(master, 'target_system', 0),
+                                 getattr(master, 'target_component', 0))
+        
+        vehicle.add_message_listener('ATTITUDE', self._on_dronekit_attitude)
+        vehicle.add_message_listener('GLOBAL_POSITION_INT', self._on_dronekit_position)
+        vehicle.add_message_listener('VFR_HUD', self._on_dronekit_vfr_hud)
+        vehicle.add_message_listener('SYS_STATUS', self._on_dronekit_sys_status)
+        vehicle.add_message_listener('GPS_RAW_INT', self._on_dronekit_gps)
+        vehicle.add_message_listener('HEARTBEAT', self._on_dronekit_heartbeat)
+    
+    # DroneKit message listeners: run on DroneKit's reader thread, plain dict writes only
+    def _on_dronekit_attitude(self, vehicle, name, msg):
+        tele = self._dronekit_telemetry
+        tele['roll'] = msg.roll * _RAD2DEG
+        tele['pitch'] = msg.pitch * _RAD2DEG
+        tele['yaw'] = msg.yaw * _RAD2DEG
+    
+    def _on_dronekit_position(self, vehicle, name, msg):
+        tele = self._dronekit_telemetry
+        tele['lat'] = msg.lat / 1e7
+        tele['lon'] = msg.lon / 1e7
+        tele['altitude'] = msg.relative_alt / 1000.0
+    
+    def _on_dronekit_vfr_hud(self, vehicle, name, msg):
+        tele = self._dronekit_telemetry
+        tele['airspeed'] = msg.airspeed
+        tele['groundspeed'] = msg.groundspeed
+    
+    def _on_dronekit_sys_status(self, vehicle, name, msg):
+        tele = self._dronekit_telemetry
+        # -1 / UINT16_MAX mean "unknown" (DroneKit reports None, shown as 0)
+        tele['batteryLevel'] = 0 if msg.battery_remaining == -1 else msg.battery_remaining
+        tele['batteryVoltage'] = 0.0 if msg.voltage_battery == _UINT16_MAX else msg.voltage_battery / 1000.0
+    
+    def _on_dronekit_gps(self, vehicle, name, msg):
+        tele = self._dronekit_telemetry
+        tele['gps_fix'] = msg.fix_type
+        tele['satellites'] = msg.satellites_visible
+    
+    def _on_dronekit_heartbeat(self, vehicle, name, msg):
+        # Only the vehicle's own autopilot: GCS, gimbal, camera, companion heartbeats carry base_mode 0
+        if msg.type == _MAV_TYPE_GCS or msg.autopilot == _MAV_AUTOPILOT_INVALID:
+            return
+        target_system, target_component = self._dronekit_target
+        if target_system and msg.get_srcSystem() != target_system:
+            return
+        if target_component and msg.get_srcComponent() != target_component:
+            return
+        
+        tele = self._dronekit_telemetry
+        tele['armed'] = bool(msg.base_mode & _MAV_MODE_FLAG_SAFETY_ARMED)
+        try:
+            tele['flightMode'] = str(vehicle.mode.name)
+        except Exception:
+            # Unknown modes are ignored (see on_dronekit_connect_finished)
+            pass
+    
+    def get_connection_string(self) -> str:
+        """Get connection string for the current UI selection."""
+        return self._connection_string
+    
+    def _update_connection_string(self, index: int = -1):
+        """Recompute the connection string after the portList selection changed."""
         try:
             selected_port = self.portList.currentText().strip()
             
-            if "COM" in selected_port.upper():
-                # Extract COM port
-                if "(" in selected_port:
-                    com_port = selected_port.split()[0]
-                else:
-                    com_port = selected_port
-                return f"{com_port},{settings.DEFAULT_BAUD_RATE}"
+            match = _SERIAL_PORT_RE.match(selected_port)
+            if match:
+                # Serial device without the "(description)" suffix
+                self._connection_string = f"{match.group(0)},{settings.DEFAULT_BAUD_RATE}"
             else:
-                return "udp:127.0.0.1:14550"
+                self._connection_string = "udp:127.0.0.1:14550"
                 
         except Exception as e:
             logger.error(f"Failed to get connection string: {e}")
-            return "udp:127.0.0.1:14550"
+            self._connection_string = "udp:127.0.0.1:14550"
     
     def disconnect_drone(self):
         """Disconnect from the drone."""
         try:
             self.connection_active = False
             
+            # A connect still running in the worker thread must not bring the link back up
+            if self._dronekit_connecting or self._mavlink_connecting:
+                self._connect_cancelled = True
+            
             # Stop telemetry updates
             if hasattr(self, 'telemetry_timer'):
                 self.telemetry_timer.stop()
                 logger.info("Telemetry timer stopped")
             
-            # Close DroneKit connection
+            # Close DroneKit connection (close() joins DroneKit's threads, so it runs in the worker)
             if self.uav:
-                self.uav.close()
-                self.uav = None
+                vehicle, self.uav = self.uav, None
+                if self.dronekit_worker:
+                    self.dronekitCloseRequested.emit(vehicle)
+                else:
+                    vehicle.close()
                 logger.info("DroneKit connection closed")
             
             # Close MAVLink connection
@@ -976,9 +1331,9 @@ UAV kontrolleri normal çalışmaya devam edecek.
                 logger.info("MAVLink connection closed")
             
             # Update UI
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append("📡 İHA bağlantısı kesildi.")
-            if hasattr(self, 'baglanti'):
+            if self._status_label is not None:
                 self.baglanti.setText("Bağlantı: 🔴 Kapalı")
             
             self.disable_flight_controls()
@@ -986,13 +1341,13 @@ UAV kontrolleri normal çalışmaya devam edecek.
             
         except Exception as e:
             logger.error(f"Disconnection failed: {e}")
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append(f"🚫 Bağlantı kesme hatası: {str(e)}")
     
     def set_flight_mode(self, mode: str):
         """Set flight mode."""
         if not self.connection_active:
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append("İHA bağlı değil!")
             return
         
@@ -1011,7 +1366,7 @@ UAV kontrolleri normal çalışmaya devam edecek.
                 success = self.mavlink_client.set_mode(mode)
                 logger.info(f"Set mode to {mode} via MAVLink")
             
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 if success:
                     self.ihaInformer.append(f"Uçuş modu {mode} olarak ayarlandı")
                 else:
@@ -1019,89 +1374,43 @@ UAV kontrolleri normal çalışmaya devam edecek.
                     
         except Exception as e:
             logger.error(f"Failed to set flight mode: {e}")
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append(f"Uçuş modu hatası: {str(e)}")
     
-    def toggle_arm_disarm(self):
-        """Toggle arm/disarm state."""
-        if not self.connection_active:
-            if hasattr(self, 'ihaInformer'):
-                self.ihaInformer.append("İHA bağlı değil!")
-            return
-        
-        try:
-            success = False
-            
-            # Try DroneKit first
-            if self.uav:
-                current_armed = self.uav.armed
-                if current_armed:
-                    self.uav.armed = False
-                    action = "disarm"
-                else:
-                    if self.uav.is_armable:
-                        self.uav.armed = True
-                        action = "arm"
-                    else:
-                        if hasattr(self, 'ihaInformer'):
-                            self.ihaInformer.append("İHA arm edilemiyor! Gerekli şartlar sağlanmadı.")
-                        return
-                success = True
-                
-            # Fallback to MAVLink
-            elif self.mavlink_client:
-                telemetry = self.mavlink_client.get_telemetry_data()
-                current_armed = telemetry.get("armed", False)
-                success = self.mavlink_client.arm_disarm(not current_armed)
-                action = "disarm" if current_armed else "arm"
-            
-            if hasattr(self, 'ihaInformer'):
-                if success:
-                    self.ihaInformer.append(f"İHA {action} komutu gönderildi.")
-                else:
-                    self.ihaInformer.append("Arm/Disarm komutu gönderilemedi.")
-                    
-        except Exception as e:
-            logger.error(f"Arm/Disarm failed: {e}")
-            if hasattr(self, 'ihaInformer'):
-                self.ihaInformer.append(f"Arm/Disarm hatası: {str(e)}")
-    
     def enable_flight_controls(self):
         """Enable flight control buttons."""
-        controls = ['AUTO', 'GUIDED', 'RTL', 'TAKEOFF', 'armDisarm']
-        for control in controls:
-            if hasattr(self, control):
-                getattr(self, control).setEnabled(True)
+        for control in self._flight_controls:
+            control.setEnabled(True)
     
     def disable_flight_controls(self):
         """Disable flight control buttons."""
-        controls = ['AUTO', 'GUIDED', 'RTL', 'TAKEOFF', 'armDisarm']
-        for control in controls:
-            if hasattr(self, control):
-                getattr(self, control).setEnabled(False)
+        for control in self._flight_controls:
+            control.setEnabled(False)
     
     def open_camera_window(self):
         """Open antenna system and video receiver window."""
         try:
-            if hasattr(self, 'ihaInformer'):
-                self.ihaInformer.append("🔄 Anten sistemi başlatılıyor...")
+            if AntennaController is None:
+                logger.error(f"Failed to import antenna modules: {_ANTENNA_IMPORT_ERROR}")
+                if self._informer is not None:
+                    self.ihaInformer.append(f"❌ Anten modülleri yüklenemedi: {_ANTENNA_IMPORT_ERROR}")
+                return
             
-            # Import antenna controller and video receiver
-            from ...communication.antenna_controller import AntennaController
-            from .video_receiver_widget import VideoDisplayWidget
+            if self._informer is not None:
+                self.ihaInformer.append("🔄 Anten sistemi başlatılıyor...")
             
             # Initialize antenna controller if not exists
             if not hasattr(self, 'antenna_controller'):
                 self.antenna_controller = AntennaController()
             
             # Start antenna system (PowerBeam listening + Rocket M5 streaming)
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append("🔧 PowerBeam 5AC Gen2 dinleme moduna alınıyor...")
             
             antenna_success = self.antenna_controller.start_antenna_system()
             
             if antenna_success:
-                if hasattr(self, 'ihaInformer'):
+                if self._informer is not None:
                     self.ihaInformer.append("✅ PowerBeam 5AC Gen2 dinleme modunda")
                     self.ihaInformer.append("✅ Rocket M5 video akışı başlatıldı")
                     self.ihaInformer.append("🎥 Video görüntüleyici açılıyor...")
@@ -1117,58 +1426,72 @@ UAV kontrolleri normal çalışmaya devam edecek.
                 
                 logger.info("Antenna system and video receiver started successfully")
                 
-                if hasattr(self, 'ihaInformer'):
+                if self._informer is not None:
                     self.ihaInformer.append("✅ Rocket M5 görüntüsü alınmaya başladı!")
             else:
-                if hasattr(self, 'ihaInformer'):
+                if self._informer is not None:
                     self.ihaInformer.append("❌ Anten sistemi başlatılamadı!")
                     self.ihaInformer.append("🔍 PowerBeam ve Rocket M5 bağlantılarını kontrol edin")
                 logger.error("Failed to start antenna system")
             
-        except ImportError as e:
-            logger.error(f"Failed to import antenna modules: {e}")
-            if hasattr(self, 'ihaInformer'):
-                self.ihaInformer.append(f"❌ Anten modülleri yüklenemedi: {str(e)}")
         except Exception as e:
             logger.error(f"Failed to open antenna system: {e}")
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append(f"❌ Anten sistemi hatası: {str(e)}")
     
     def start_camera_process(self):
-        """Start camera process."""
+        """Start camera process (one QProcess, its output drained by the event loop)."""
         try:
             # Define camera script path
             camera_script = settings.PROJECT_ROOT / "src" / "uav_system" / "computer_vision" / "camera_system.py"
             
-            if camera_script.exists():
-                self.camera_process = subprocess.Popen(
-                    [sys.executable, str(camera_script)],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
-                logger.info("Camera process started")
-            else:
+            if not camera_script.exists():
                 logger.error(f"Camera script not found: {camera_script}")
+                return
+            
+            if self.camera_process is None:
+                self.camera_process = QProcess(self)
+                self.camera_process.setProcessChannelMode(QProcess.MergedChannels)
+                self.camera_process.readyReadStandardOutput.connect(self._log_camera_output)
+            elif self.camera_process.state() != QProcess.NotRunning:
+                logger.info("Camera process already running")
+                return
+            
+            self.camera_process.start(sys.executable, [str(camera_script)])
+            logger.info("Camera process started")
                 
         except Exception as e:
             logger.error(f"Failed to start camera process: {e}")
     
+    def _log_camera_output(self):
+        """Read the camera child's output so its pipe never fills up."""
+        output = bytes(self.camera_process.readAllStandardOutput()).decode(errors='replace').rstrip()
+        if output:
+            logger.debug("Camera: %s", output)
+    
     def update_server_time(self):
-        """Update server time display."""
-        if hasattr(self, 'sunucuSaati'):
-            current_time = QDateTime.currentDateTime().toString('yyyy-MM-dd hh:mm:ss')
-            self.sunucuSaati.setText(f"Sunucu Saati: {current_time}")
+        """Update server time display (formatted only when the second rolled over)."""
+        if self._clock_label is not None:
+            # CoarseTimer may fire twice within one second; skip the locale-aware format then
+            now_sec = QDateTime.currentSecsSinceEpoch()
+            if now_sec == self._last_clock_sec:
+                return
+            self._last_clock_sec = now_sec
+            current_time = QDateTime.fromSecsSinceEpoch(now_sec).toString('yyyy-MM-dd hh:mm:ss')
+            self._clock_label.setText(f"Sunucu Saati: {current_time}")
     
-    def update_telemetry_display(self):
-        """Update telemetry display."""
+    def poll_telemetry(self):
+        """Fetch the latest telemetry sample; drawing happens on the redraw timer."""
         try:
             # Get telemetry data
-            if self.connection_active and self.mavlink_client:
+            if self.connection_active and self.uav:
+                telemetry = self.get_current_telemetry()
+            elif self.connection_active and self.mavlink_client:
+                if self.mavlink_client.is_connected:
+                    return  # MAVLinkWorker pushes samples via on_telemetry_received
                 telemetry = self.mavlink_client.get_telemetry_data()
             else:
                 # Simülasyon telemetri verisi (bağlantı yoksa)
-                import time
-                import math
                 current_time = time.time()
                 telemetry = {
                     'lat': 39.9334 + math.sin(current_time * 0.1) * 0.001,
@@ -1190,35 +1513,44 @@ UAV kontrolleri normal çalışmaya devam edecek.
                     'targetBearing': 45
                 }
             
+            self._store_telemetry(telemetry)
+            
+        except Exception as e:
+            logger.error(f"Telemetry poll failed: {e}")
+    
+    @pyqtSlot(dict)
+    def on_telemetry_received(self, telemetry: Dict[str, Any]):
+        """Store a telemetry sample pushed from the MAVLink RX thread."""
+        self._store_telemetry(telemetry)
+    
+    def _store_telemetry(self, telemetry: Dict[str, Any]):
+        """Keep the newest sample and arm the redraw timer if it is idle."""
+        self._latest_telemetry = telemetry
+        self._telemetry_dirty = True
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start()
+    
+    def update_telemetry_display(self):
+        """Update telemetry display with the latest sample (skipped when unchanged)."""
+        if not self._telemetry_dirty:
+            return
+        self._telemetry_dirty = False
+        
+        try:
+            telemetry = self._latest_telemetry
+            
             # Update UI labels
             self.update_ui_labels(telemetry)
             
-            # Update HUD if available
+            # Update HUD if available (roll/pitch/yaw are part of the same sample;
+            # the HUD coalesces these into one render and repaints when the frame is ready)
             if self.hud_widget:
-                # 1) Flight-data & bağlantı durumu
                 self.hud_widget.update_flight_data(telemetry)
                 self.hud_widget.set_connection_status(self.connection_active)
-
-                # 2) Roll / Pitch / Yaw değerlerini de ilet
-                roll  = telemetry.get('roll',  0.0)
-                pitch = telemetry.get('pitch', 0.0)
-                yaw   = telemetry.get('yaw',   0.0)
-                self.hud_widget.update_attitude(roll, pitch, yaw)
-                
-                # 3) Force repaint to ensure HUD is visible
-                self.hud_widget.update()
-                self.hud_widget.repaint()
             
-            # Update map with UAV data - use the new method  
+            # Update map with UAV data (same sample, no per-tick dict)
             if self.connection_active:
-                self.update_map_with_uav_data({
-                    'lat': telemetry.get('lat', self.current_telemetry['lat']),
-                    'lon': telemetry.get('lon', self.current_telemetry['lon']),
-                    'alt': telemetry.get('altitude', self.current_telemetry['alt']),
-                    'yaw': telemetry.get('yaw', self.current_telemetry['heading']),
-                    'mode': telemetry.get('flightMode', self.current_telemetry['flight_mode']),
-                    'armed': telemetry.get('armed', self.current_telemetry['armed'])
-                })
+                self.update_map_with_uav_data(telemetry)
                 
         except Exception as e:
             logger.error(f"Telemetry update failed: {e}")
@@ -1228,24 +1560,9 @@ UAV kontrolleri normal çalışmaya devam edecek.
         telemetry = {}
         
         try:
-            # Try DroneKit first
+            # Try DroneKit first (dict kept current by the message listeners)
             if self.uav:
-                telemetry = {
-                    "lat": float(self.uav.location.global_relative_frame.lat or 0),
-                    "lon": float(self.uav.location.global_relative_frame.lon or 0),
-                    "altitude": float(self.uav.location.global_relative_frame.alt or 0),
-                    "roll": math.degrees(float(self.uav.attitude.roll or 0)),
-                    "pitch": math.degrees(float(self.uav.attitude.pitch or 0)),
-                    "yaw": math.degrees(float(self.uav.attitude.yaw or 0)),
-                    "airspeed": float(self.uav.airspeed or 0),
-                    "groundspeed": float(self.uav.groundspeed or 0),
-                    "armed": bool(self.uav.armed),
-                    "flightMode": str(self.uav.mode.name),
-                    "batteryLevel": float(self.uav.battery.level or 0),
-                    "batteryVoltage": float(self.uav.battery.voltage or 0),
-                    "gps_fix": int(self.uav.gps_0.fix_type if hasattr(self.uav, 'gps_0') else 0),
-                    "satellites": int(self.uav.gps_0.satellites_visible if hasattr(self.uav, 'gps_0') else 0),
-                }
+                telemetry = self._dronekit_telemetry
                 
                 # Update current telemetry cache
                 self.current_telemetry.update(telemetry)
@@ -1259,112 +1576,143 @@ UAV kontrolleri normal çalışmaya devam edecek.
         except Exception as e:
             logger.error(f"Failed to get telemetry: {e}")
         
-        return telemetry or self.current_telemetry
+        return telemetry or asdict(self.current_telemetry)
     
     def update_map_with_uav_data(self, uav_data: Dict[str, Any]):
-        """Update map with UAV position and data."""
+        """Queue a UAV position for the map; the latest one is pushed on the next flush."""
         try:
             if not uav_data:
                 return
                 
-            lat = uav_data.get('lat', self.current_telemetry['lat'])
-            lon = uav_data.get('lon', self.current_telemetry['lon'])
-            alt = uav_data.get('alt', self.current_telemetry['alt'])
-            heading = uav_data.get('yaw', self.current_telemetry['heading'])
+            state = self.current_telemetry
+            lat = uav_data.get('lat', state.lat)
+            lon = uav_data.get('lon', state.lon)
+            alt = uav_data.get('altitude', state.alt)
+            heading = uav_data.get('yaw', state.heading)
             
+            # Update current telemetry cache
+            state.lat = lat
+            state.lon = lon
+            state.alt = alt
+            state.heading = heading
+            
+            # Skip positions the map would not visibly show (~0.1 m, 0.5 m alt, 1° heading)
+            last = self._last_map_pos
+            if last is not None:
+                last_lat, last_lon, last_alt, last_heading = last
+                if (abs(lat - last_lat) <= MAP_UPDATE_MIN_DEG and abs(lon - last_lon) <= MAP_UPDATE_MIN_DEG
+                        and abs(alt - last_alt) <= MAP_UPDATE_MIN_ALT
+                        and abs((heading - last_heading + 180) % 360 - 180) <= MAP_UPDATE_MIN_HEADING):
+                    return
+            
+            # Last value wins; one map push per flush interval
+            self._pending_map_pos = self._last_map_pos = (lat, lon, alt, heading)
+            if not self._map_flush_timer.isActive():
+                self._map_flush_timer.start()
+            
+        except Exception as e:
+            logger.error(f"Failed to update map with UAV data: {e}")
+    
+    def _flush_map_update(self):
+        """Push the most recent queued UAV position to the map."""
+        if self._pending_map_pos is None:
+            return
+        lat, lon, alt, heading = self._pending_map_pos
+        self._pending_map_pos = None
+        
+        try:
             # Update Leaflet map if available
-            if hasattr(self, 'leaflet_map') and self.leaflet_map and self.leaflet_map.map_loaded:
+            if self.leaflet_map and self.leaflet_map.map_loaded:
                 self.leaflet_map.update_uav_position(lat, lon, heading)
                 
                 # Auto-center on UAV if this is the first position update
-                if not hasattr(self, '_map_centered_on_uav'):
+                if not self._map_centered_on_uav:
                     self.leaflet_map.set_map_center(lat, lon, 15)
                     self._map_centered_on_uav = True
                     
             # Update other map widget if available
-            elif hasattr(self, 'map_widget') and self.map_widget:
+            elif self.map_widget and self._offline_map_ready:
+                self._offline_map_bridge.telemetryChanged.emit(
+                    lat, lon, alt, heading, self.current_telemetry.battery_voltage)
+            
+            # Page without the channel (yet): one runJavaScript call
+            elif self.map_widget:
                 try:
-                    js_code = f"""
-                    if (typeof updateUAVPosition === 'function') {{
-                        updateUAVPosition({lat}, {lon}, {heading});
-                    }}
-                    if (typeof map !== 'undefined' && map && map.setView) {{
-                        map.setView([{lat}, {lon}], map.getZoom());
-                    }}
-                    """
-                    self.map_widget.page().runJavaScript(js_code)
+                    # Sabit çağrı + JSON veri: sayfa tek bir applyTelemetry(obj) çalıştırır
+                    payload = self._map_payload
+                    payload['lat'] = lat
+                    payload['lon'] = lon
+                    payload['alt'] = alt
+                    payload['heading'] = heading
+                    payload['battery'] = self.current_telemetry.battery_voltage
+                    self.map_widget.page().runJavaScript("applyTelemetry(" + json.dumps(payload) + ")")
                 except Exception as e:
-                    logger.debug(f"JavaScript execution failed: {e}")
+                    logger.debug("JavaScript execution failed: %s", e)
             
-            # Update current telemetry cache
-            self.current_telemetry.update({
-                'lat': lat,
-                'lon': lon,
-                'alt': alt,
-                'heading': heading
-            })
-            
-            logger.debug(f"Map updated with UAV position: {lat:.6f}, {lon:.6f}, heading: {heading:.1f}°")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Map updated with UAV position: %.6f, %.6f, heading: %.1f°", lat, lon, heading)
             
         except Exception as e:
             logger.error(f"Failed to update map with UAV data: {e}")
     
     def toggle_arm_disarm(self):
-        """Toggle arm/disarm state."""
+        """Toggle arm/disarm state (current state comes from the pushed telemetry)."""
         if not self.connection_active:
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append("İHA bağlı değil!")
             return
         try:
-           # DroneKit varsa önce onu kullan
+            success = False
+            
+            # DroneKit varsa önce onu kullan
             if self.uav:
-                current = self.uav.armed
+                current = bool(self._dronekit_telemetry.get('armed', False))
                 self.uav.armed = not current
                 success = True
-                action = "ARM" if not current else "DISARM"
 
             # MAVLink fallback
             elif self.mavlink_client:
-                tel = self.mavlink_client.get_telemetry_data()
-                current = tel.get("armed", False)
+                current = bool(self._latest_telemetry.get('armed', False))
                 success = self.mavlink_client.arm_disarm(not current)
-                action = "ARM" if not current else "DISARM"
 
-           # Kullanıcıya bilgi
-            if hasattr(self, 'ihaInformer'):
+            # Kullanıcıya bilgi
+            if self._informer is not None:
                 if success:
-                    self.ihaInformer.append(f"İHA {action} komutu gönderildi.")
+                    self.ihaInformer.append(f"İHA {'DISARM' if current else 'ARM'} komutu gönderildi.")
                     # Düğme metnini de güncelle
                     if hasattr(self, 'armDisarm'):
-                       self.armDisarm.setText("DISARM" if not current else "ARM")
+                        self.armDisarm.setText("ARM" if current else "DISARM")
                 else:
                     self.ihaInformer.append("Arm/Disarm işlemi başarısız.")
 
         except Exception as e:
-            import logging
-            logging.error(f"Arm/Disarm hatası: {e}")
-            if hasattr(self, 'ihaInformer'):
+            logger.error(f"Arm/Disarm hatası: {e}")
+            if self._informer is not None:
                 self.ihaInformer.append(f"Arm/Disarm hatası: {e}")
     
     def update_ui_labels(self, telemetry: Dict[str, Any]):
         """Update UI labels with telemetry data."""
         try:
-            labels = {
-                'enlem': f"Lat: {telemetry.get('lat', 0):.6f}°",
-                'boylam': f"Lon: {telemetry.get('lon', 0):.6f}°",
-                'irtifa': f"Alt: {telemetry.get('altitude', 0):.1f}m",
-                'roll': f"Roll: {telemetry.get('roll', 0):+.1f}°",
-                'pitch': f"Pitch: {telemetry.get('pitch', 0):+.1f}°",
-                'yaw': f"Yaw: {telemetry.get('yaw', 0):.1f}°",
-                'havaHizi': f"AS: {telemetry.get('airspeed', 0):.1f}m/s",
-                'yerHizi': f"GS: {telemetry.get('groundspeed', 0):.1f}m/s",
-                'mevcutUcusModu': f"Mode: {telemetry.get('flightMode', 'UNKNOWN')}",
-                'armDurum': f"{'ARMED' if telemetry.get('armed', False) else 'DISARMED'}",
-            }
-            
-            for label_name, text in labels.items():
-                if hasattr(self, label_name):
-                    getattr(self, label_name).setText(text)
+            last_displayed = self._last_displayed
+            
+            # Values at display precision: noise below the shown digits does not count as a change
+            for label_name, widget, fmt, key, digits in self._numeric_labels:
+                value = round(telemetry.get(key, 0.0), digits)
+                if last_displayed.get(label_name) != value:
+                    last_displayed[label_name] = value
+                    widget.setText(fmt % value)
+            
+            if self._mode_label is not None:
+                mode = telemetry.get('flightMode', 'UNKNOWN')
+                if last_displayed.get('mevcutUcusModu') != mode:
+                    last_displayed['mevcutUcusModu'] = mode
+                    self._mode_label.setText("Mode: %s" % mode)
+            
+            if self._arm_label is not None:
+                arm_text = 'ARMED' if telemetry.get('armed', False) else 'DISARMED'
+                if last_displayed.get('armDurum') != arm_text:
+                    last_displayed['armDurum'] = arm_text
+                    self._arm_label.setText(arm_text)
                     
         except Exception as e:
             logger.error(f"Failed to update UI labels: {e}")
@@ -1373,7 +1721,7 @@ UAV kontrolleri normal çalışmaya devam edecek.
         """Show map error message."""
         if hasattr(self, 'label'):
             self.label.setText(f"Harita Hatası: {error_msg}")
-            self.label.setStyleSheet("color: red; font-size: 12pt; padding: 20px;")
+            self._apply_style(self.label, self._MAP_ERROR_QSS)
     
     def on_map_timeout(self):
         """Handle map loading timeout - fallback to offline mode."""
@@ -1390,17 +1738,42 @@ UAV kontrolleri normal çalışmaya devam edecek.
             )
             
             if reply == QMessageBox.Yes:
-                # Cleanup antenna system first
-                self.close_antenna_system()
+                self.connection_active = False
+                if self._dronekit_connecting or self._mavlink_connecting:
+                    self._connect_cancelled = True
+                if hasattr(self, 'telemetry_timer'):
+                    self.telemetry_timer.stop()
                 
-                # Cleanup drone connection
-                self.disconnect_drone()
+                # Blocking teardown (antenna sockets, DroneKit/MAVLink links) runs in parallel
+                pool = QThreadPool.globalInstance()
+                if hasattr(self, 'antenna_controller'):
+                    pool.start(ShutdownTask("antenna", self.antenna_controller.stop_antenna_system))
+                if self.uav:
+                    vehicle, self.uav = self.uav, None
+                    pool.start(ShutdownTask("dronekit", vehicle.close))
+                if self.mavlink_client:
+                    pool.start(ShutdownTask("mavlink", self.mavlink_client.disconnect))
                 
-                # Stop processes
+                # GUI-side cleanup meanwhile
+                if hasattr(self, 'video_window'):
+                    self.video_window.stop_video_stream()
+                    self.video_window.close()
                 if self.camera_process:
                     self.camera_process.terminate()
                 if self.camera_window_process:
                     self.camera_window_process.terminate()
+                # A connect still blocking in the worker thread keeps it alive past quit();
+                # destroying a running QThread at exit aborts, so that case exits hard too
+                thread_stopped = True
+                if self.mav_thread:
+                    self.mav_thread.quit()
+                    thread_stopped = self.mav_thread.wait(2000)
+                
+                # Bounded shutdown: a link stuck on a dead port must not hang the exit
+                if not pool.waitForDone(5000) or not thread_stopped:
+                    logger.warning("Shutdown steps still running, exiting anyway")
+                    logging.shutdown()
+                    os._exit(0)
                 
                 event.accept()
                 logger.info("Application closed")
@@ -1411,22 +1784,6 @@ UAV kontrolleri normal çalışmaya devam edecek.
             logger.error(f"Close event error: {e}")
             event.accept()
     
-    def on_hud_container_resize(self, event):
-        """Handle resize events for the HUD container (label_2)."""
-        if hasattr(self, 'hud_widget') and self.hud_widget:
-            # Update HUD widget size to match its container
-            container_size = self.label_2.size()
-            self.hud_widget.setGeometry(0, 0, container_size.width(), container_size.height())
-            self.hud_widget.resize(container_size)
-            self.hud_widget.setMinimumSize(container_size)
-            self.hud_widget.setMaximumSize(container_size)
-            self.hud_widget.raise_()  # Keep HUD on top
-            self.hud_widget.update()  # Force repaint
-        
-        # Call the original resize event if it exists
-        if hasattr(self.label_2.__class__, 'resizeEvent'):
-            super(self.label_2.__class__, self.label_2).resizeEvent(event)
-    
     def resizeEvent(self, event):
         """Handle window resize events to keep map widget fitted."""
         super().resizeEvent(event)
@@ -1441,8 +1798,8 @@ UAV kontrolleri normal çalışmaya devam edecek.
                         self.label.layout().setContentsMargins(0, 0, 0, 0)
                         self.label.layout().setSpacing(0)
                     
-                    # Force map resize after a small delay
-                    QTimer.singleShot(100, lambda: self.leaflet_map.force_refresh_map() if self.leaflet_map else None)
+                    # Force map resize once the resize burst settles
+                    self._resize_debounce.start()
             
             # Resize offline map widget if it exists
             elif hasattr(self, 'map_widget') and self.map_widget and hasattr(self, 'label'):
@@ -1459,6 +1816,11 @@ UAV kontrolleri normal çalışmaya devam edecek.
         except Exception as e:
             logger.error(f"Error in resizeEvent: {e}")
     
+    def _refresh_map_after_resize(self):
+        """Refresh the Leaflet map after a window resize settled."""
+        if self.leaflet_map:
+            self.leaflet_map.force_refresh_map()
+    
     def set_webengine_status(self, available: bool):
         """Set WebEngine availability status."""
         self.webengine_available = available
@@ -1471,7 +1833,7 @@ UAV kontrolleri normal çalışmaya devam edecek.
     def close_antenna_system(self):
         """Close antenna system and video receiver."""
         try:
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append("🔄 Anten sistemi kapatılıyor...")
             
             # Stop antenna system
@@ -1479,11 +1841,11 @@ UAV kontrolleri normal çalışmaya devam edecek.
                 antenna_stopped = self.antenna_controller.stop_antenna_system()
                 
                 if antenna_stopped:
-                    if hasattr(self, 'ihaInformer'):
+                    if self._informer is not None:
                         self.ihaInformer.append("✅ PowerBeam 5AC Gen2 normal moda döndürüldü")
                         self.ihaInformer.append("✅ Rocket M5 video akışı durduruldu")
                 else:
-                    if hasattr(self, 'ihaInformer'):
+                    if self._informer is not None:
                         self.ihaInformer.append("⚠️ Anten sistemi kısmen kapatıldı")
             
             # Close video window
@@ -1492,14 +1854,14 @@ UAV kontrolleri normal çalışmaya devam edecek.
                 self.video_window.close()
                 delattr(self, 'video_window')
                 
-                if hasattr(self, 'ihaInformer'):
+                if self._informer is not None:
                     self.ihaInformer.append("✅ Video görüntüleyici kapatıldı")
             
             logger.info("Antenna system closed successfully")
             
         except Exception as e:
             logger.error(f"Error closing antenna system: {e}")
-            if hasattr(self, 'ihaInformer'):
+            if self._informer is not None:
                 self.ihaInformer.append(f"❌ Anten sistemi kapatma hatası: {str(e)}")
 
 
@@ -5,6 +5,7 @@ Provides interactive map display with UAV tracking and mission planning using HT
 
 import json
 import os
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget
@@ -34,8 +35,8 @@ class SimpleCanvasMap(QWidget):
         
         # UAV tracking
         self.uav_position = None
-        self.uav_track = []
         self.max_track_points = 1000
+        self.uav_track = deque(maxlen=self.max_track_points)
         
         # Waypoints and missions
         self.waypoints = {}
@@ -788,10 +789,8 @@ class SimpleCanvasMap(QWidget):
         try:
             self.uav_position = {'lat': lat, 'lon': lon, 'heading': heading}
             
-            # Add to track
+            # Add to track (the deque drops the oldest point once full)
             self.uav_track.append((lat, lon))
-            if len(self.uav_track) > self.max_track_points:
-                self.uav_track.pop(0)
             
             # Update coordinates display
             self.lbl_coordinates.setText(f"Lat: {lat:.6f}, Lon: {lon:.6f}")
@@ -0,0 +1,52 @@
+"""
+MAVLink worker for the desktop GCS.
+Runs the blocking MAVLink connect off the GUI thread and relays telemetry as Qt signals.
+"""
+
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from ...communication.mavlink.mavlink_client import MAVLinkClient
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class MAVLinkWorker(QObject):
+    """Owns the MAVLink client's connect step and forwards telemetry to the GUI thread."""
+
+    # Emitted once the connect attempt finishes (True on heartbeat)
+    connectFinished = pyqtSignal(bool)
+    # Emitted from the client's RX thread at most max_rate times per second;
+    # receivers in the GUI thread get it queued
+    telemetryUpdated = pyqtSignal(dict)
+
+    def __init__(self, client: MAVLinkClient, max_rate: float = 10.0, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self._min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._last_emit = 0.0
+        self.client.set_telemetry_callback(self._on_telemetry)
+
+    def _on_telemetry(self, telemetry: dict):
+        """Rate-limit samples before they cross threads (runs on the client's RX thread).
+
+        The stream keeps sending (attitude/position at several Hz, heartbeat at 1 Hz),
+        so a skipped sample is superseded by the next one after the interval.
+        """
+        now = time.monotonic()
+        if now - self._last_emit < self._min_interval:
+            return
+        self._last_emit = now
+        self.telemetryUpdated.emit(telemetry.copy())
+
+    @pyqtSlot(str)
+    def run(self, connection_string: str):
+        """Connect and wait for the first heartbeat (blocking, runs in the worker thread)."""
+        try:
+            success = self.client.connect(connection_string)
+        except Exception as e:
+            logger.error(f"MAVLink worker connect failed: {e}")
+            success = False
+        self.connectFinished.emit(success)
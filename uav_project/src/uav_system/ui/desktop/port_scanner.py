@@ -0,0 +1,52 @@
+"""
+Background serial port enumeration for the desktop GCS.
+comports() can take a noticeable time on Windows (SetupAPI), so it never runs on the GUI thread.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import serial.tools.list_ports
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Last enumeration: (monotonic timestamp, [(device, description)]); None until the first scan
+_port_cache: Optional[Tuple[float, List[Tuple[str, str]]]] = None
+
+
+def get_ports_cached(ttl: float = 3.0) -> List[Tuple[str, str]]:
+    """Return (device, description) pairs, re-enumerating at most once per ttl seconds."""
+    global _port_cache
+    now = time.monotonic()
+    cached = _port_cache
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    ports = [(p.device, p.description) for p in serial.tools.list_ports.comports()]
+    _port_cache = (now, ports)
+    return ports
+
+
+class PortScanSignals(QObject):
+    """Signals for PortScanTask (QRunnable itself cannot emit)."""
+
+    # List of (device, description) tuples
+    finished = pyqtSignal(list)
+
+
+class PortScanTask(QRunnable):
+    """Enumerate serial ports in a QThreadPool worker."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = PortScanSignals()
+
+    def run(self):
+        ports: List[Tuple[str, str]] = []
+        try:
+            ports = get_ports_cached()
+        except Exception as e:
+            logger.error(f"Serial port scan failed: {e}")
+        self.signals.finished.emit(ports)
@@ -0,0 +1,28 @@
+"""
+Shutdown helpers for the desktop GCS.
+Link and antenna teardown can block on a dead connection, so closeEvent runs it in a thread pool.
+"""
+
+from typing import Callable
+
+from PyQt5.QtCore import QRunnable
+
+from ...core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ShutdownTask(QRunnable):
+    """Run one blocking cleanup call in a QThreadPool worker."""
+
+    def __init__(self, name: str, func: Callable[[], object]):
+        super().__init__()
+        self.name = name
+        self.func = func
+
+    def run(self):
+        try:
+            self.func()
+            logger.info(f"Shutdown step finished: {self.name}")
+        except Exception as e:
+            logger.error(f"Shutdown step failed ({self.name}): {e}")